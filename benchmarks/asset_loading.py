@@ -0,0 +1,59 @@
+"""
+Compare serial and thread pool png decoding on a synthetic art folder.
+
+run from the repo root: python -m benchmarks.asset_loading [frames] [size] [threads]
+"""
+import os
+import sys
+import tempfile
+
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from src.assets import assets
+
+
+def make_folder(path: str, frames: int, size: int) -> None:
+    """write noisy numbered frames split over a few animation folders"""
+    rng = np.random.default_rng(0)
+    for i in range(frames):
+        folder = os.path.join(path, f"ship{i % 8}", "idle")
+        os.makedirs(folder, exist_ok=True)
+        pixels = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+        pygame.image.save(
+            pygame.surfarray.make_surface(pixels), os.path.join(folder, f"{i}.png")
+        )
+
+
+def best_of(runs: int, specs: list, workers: int) -> float:
+    times: list = []
+    for _ in range(runs):
+        start = perf_counter()
+        assets._prepare_all(specs, workers)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else max(assets._decode_workers, 2)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    with tempfile.TemporaryDirectory() as folder:
+        make_folder(folder, frames, size)
+        specs = assets._scan(folder)
+
+        serial = best_of(3, specs, 1)
+        parallel = best_of(3, specs, workers)
+
+    print(f"{len(specs)} frames of {size}x{size}")
+    print(f"serial:   {serial * 1000:8.1f} ms")
+    print(f"parallel: {parallel * 1000:8.1f} ms ({workers} threads)")
+    print(f"speedup:  {serial / parallel:8.2f}x")
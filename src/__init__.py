@@ -1,3 +1,5 @@
-from .settings import width, height, size
+from .settings import width, height, size, tick_rate, max_fps, idle_fps
 
+from .timestep import FixedTimestep
+from .profiler import FrameProfiler
 from .state import State
@@ -1 +1,14 @@
-from .assets import init, get_image
+from .assets import (
+    init,
+    get_font,
+    get_image,
+    get_mask,
+    get_palette,
+    render_text,
+    with_alpha,
+    prefetch,
+    hold,
+    release,
+    convert,
+    convert_alpha,
+)
@@ -1,94 +1,221 @@
 import os
 
-from pygame import Surface, image, transform, mask
-from pygame.constants import BLEND_ALPHA_SDL2
+import numpy as np
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+from pygame import Rect, Surface, image, transform, mask, display, surfarray, font
+from pygame.mask import Mask
+from pygame.constants import BLEND_ALPHA_SDL2, SRCALPHA
+
+from . import bake
 
 
 _images_directory: str = os.path.abspath(os.path.join(os.getcwd(), "images"))
-# this dict gets populated once the method get_sprite_images gets run once
-_sprite_images: dict = {}
+# size numbered animation frames get scaled to
+_frame_size: tuple = (64, 64)
+# threads decoding pngs, pygame releases the GIL while it decodes
+_decode_workers: int = min(8, os.cpu_count() or 1)
+# loaded images by top level key, least recently used first
+_sprite_images: OrderedDict = OrderedDict()
+# bytes of pixel data held for each loaded key
+_sprite_bytes: dict = {}
+# unused keys get evicted once loaded images pass this many bytes
+_byte_budget: int = 32 * 1024 * 1024
+# number of hold calls without a matching release by key, held keys are never evicted
+_holds: dict = {}
+# (scan position, spec) pairs of every png by top level key, filled by init
+_index: dict = {}
+# alpha variants of shared images by alpha, dropped along with the image
+_alpha_variants: WeakKeyDictionary = WeakKeyDictionary()
+# colors of images by their keys, see get_palette
+_palettes: dict = {}
+# collision masks of shared images, dropped along with the image
+_masks: WeakKeyDictionary = WeakKeyDictionary()
+# fonts by (name, size, bold)
+_fonts: dict = {}
+# rendered text by (text, font key, color, background), least recently used first
+_texts: OrderedDict = OrderedDict()
+# most rendered texts kept
+_text_capacity: int = 256
+
+
+class _Spec(NamedTuple):
+    """A png file and where its image goes in _sprite_images"""
+
+    # dict keys leading to the image, or to the frame list for numbered frames
+    keys: tuple
+    path: str
+    frame: bool
+    sheet: bool
 
 
-def _load(path: str, imgs_dict: dict, prev_key: str = None) -> None:
-    """Recursive method that loads _sprite_images with
-       all the images in the path arg directory
+def _sort_key(file: str) -> str:
+    """order numbered frames numerically, 2.png before 10.png"""
+    return file.zfill(16) if file[0].isdigit() else file
+
+
+def _scan(path: str, keys: tuple = ()) -> list[_Spec]:
+    """Recursively list every png in the path arg directory
+       in a deterministic order
 
     Args:
         path (str): head directory location
-        imgs_dict (dict): dictionary being populated
-        prev_key (str, optional): key of previous directory. Defaults to None.
-    """
-    if prev_key:
-        imgs_dict[prev_key] = {}
-    img_size: tuple = (64, 64)
-    temp_imgs: list = []
+        keys (tuple, optional): dict keys of the directories above path. Defaults to ().
 
+    Returns:
+        list[_Spec]: one spec per png, frames in numeric order
+    """
+    specs: list = []
     try:
-        for file in os.listdir(path):
+        for file in sorted(os.listdir(path), key=_sort_key):
             if file[-4:] == ".png":
-
                 if file[0].isdigit():
-                    img: Surface = _load_image(os.path.join(path, file))
-                    img: Surface = transform.scale(img, img_size)
-                    temp_imgs.append(img)
-
+                    specs.append(_Spec(keys, os.path.join(path, file), True, False))
                 else:
-                    img: Surface = _load_image(
-                        os.path.join(path, file),
-                    )
                     str_parts = file[:-4].split("_")
-
-                    if str_parts[-1] == "sheet":
-                        img = _get_subimages(img)
-                    imgs_dict[str_parts[0]] = img
+                    specs.append(
+                        _Spec(
+                            (*keys, str_parts[0]),
+                            os.path.join(path, file),
+                            False,
+                            str_parts[-1] == "sheet",
+                        )
+                    )
 
             elif not file[0] == ".":
-                if prev_key:
-                    _load(
-                        os.path.abspath(os.path.join(path, file)),
-                        imgs_dict[prev_key],
-                        file,
-                    )
-                else:
-                    _load(
-                        os.path.abspath(os.path.join(path, file)),
-                        imgs_dict,
-                        file,
-                    )
+                specs.extend(_scan(os.path.abspath(os.path.join(path, file)), (*keys, file)))
     except NotADirectoryError as ex:
         print(f"{ex.filename} not an accepted file type.")
-    if len(temp_imgs) > 0:
-        imgs_dict[prev_key] = temp_imgs
+    return specs
 
 
-def _load_image(path: str) -> Surface:
-    """Get an image from a given path
+def _prepare(spec: _Spec, decoded: Surface = None) -> tuple[Surface, list]:
+    """Load a spec's png and do the work that can be baked into the cache
 
     Args:
-        path (str): file location
+        spec (_Spec): image to load
+        decoded (Surface, optional): the png already decoded. Defaults to decoding it here.
+
+    Returns:
+        tuple[Surface, list]: the image and the sub-rects of a sprite sheet or None
+    """
+    img: Surface = _colorkey_image(decoded or image.load(spec.path))
+    if spec.frame:
+        img = transform.scale(img, _frame_size)
+    return (img, _get_subrects(img) if spec.sheet else None)
+
+
+def _prepare_all(specs: list[_Spec], workers: int = None) -> list[tuple[Surface, list]]:
+    """Decode pngs on a thread pool, then prepare them on this thread in spec order
+
+    Args:
+        specs (list[_Spec]): images to load
+        workers (int, optional): decoding threads. Defaults to _decode_workers.
+
+    Returns:
+        list[tuple[Surface, list]]: an (image, sub-rects) pair per spec
+    """
+    workers = workers or _decode_workers
+    if workers < 2 or len(specs) < 2:
+        return [_prepare(spec) for spec in specs]
+
+    with ThreadPoolExecutor(workers) as pool:
+        decoded: list = list(pool.map(image.load, [spec.path for spec in specs]))
+    return [_prepare(spec, img) for spec, img in zip(specs, decoded)]
+
+
+def _insert(imgs_dict: dict, spec: _Spec, img: Surface, rects: list) -> None:
+    """Place a prepared image into the nested images dict
+
+    Args:
+        imgs_dict (dict): dictionary being populated
+        spec (_Spec): where the image goes
+        img (Surface): prepared image
+        rects (list): sprite sheet sub-rects or None
+    """
+    for key in spec.keys[:-1]:
+        imgs_dict = imgs_dict.setdefault(key, {})
+
+    if spec.frame:
+        imgs_dict.setdefault(spec.keys[-1], []).append(img)
+    elif rects is not None:
+        imgs_dict[spec.keys[-1]] = _get_subimages(img, rects)
+    else:
+        imgs_dict[spec.keys[-1]] = img
+
+
+def _colorkey_image(img: Surface) -> Surface:
+    """Convert a decoded image to the display format
+
+    Args:
+        img (Surface): decoded png
 
     Returns:
         Surface: pygame surface with the colorkey set to the color of the top left (0,0) pixel
     """
-    img = image.load(path).convert()
+    img = convert(img)
     img.set_colorkey(img.get_at((0, 0)))
     return img
 
 
-def _get_subimages(image: Surface) -> list[Surface]:
+def convert(surf: Surface) -> Surface:
+    """Convert a surface to the display's pixel format
+
+    Args:
+        surf (Surface): surface to convert
+
+    Returns:
+        Surface: converted surface, or surf unchanged when there is no display (headless)
+    """
+    if display.get_surface() is None:
+        return surf
+    return surf.convert()
+
+
+def convert_alpha(surf: Surface) -> Surface:
+    """Convert a surface to the display's pixel format with per pixel alpha
+
+    Args:
+        surf (Surface): surface to convert
+
+    Returns:
+        Surface: converted surface, or a plain SRCALPHA copy when there is no display (headless)
+    """
+    if display.get_surface() is None:
+        _surf = Surface(surf.get_size(), flags=SRCALPHA)
+        _surf.blit(surf, (0, 0))
+        return _surf
+    return surf.convert_alpha()
+
+
+def _get_subrects(image: Surface) -> list[Rect]:
+    """Find the sprites on a sheet
+
+    Args:
+        image (Surface): pygame Surface
+
+    Returns:
+        list[Rect]: bounding rect of every sprite on the sheet
+    """
+    return mask.from_surface(image, threshold=174).get_bounding_rects()
+
+
+def _get_subimages(image: Surface, rects: list[Rect] = None) -> list[Surface]:
     """Remove as much as the colorkey as possible from the image
 
     Args:
         image (Surface): pygame Surface
-        size (tuple, optional): . Defaults to None.
+        rects (list[Rect], optional): sprite rects on the sheet. Defaults to finding them.
 
     Returns:
-        list[Surface]: _description_
+        list[Surface]: one surface per sprite on the sheet
     """
     _img = image
     _colorkey = _img.get_at((0, 0))
-    _mask = mask.from_surface(_img, threshold=174)
-    _rects = _mask.get_bounding_rects()
+    _rects = rects if rects is not None else _get_subrects(_img)
 
     _images = list()
     for (surf, rect) in [
@@ -108,33 +235,284 @@ def _get_subimages(image: Surface) -> list[Surface]:
     return _images
 
 
+def _get_masks(images: Surface | list | dict) -> None:
+    """Build the collision mask of every image under a loaded key
+
+    Args:
+        images (Surface | list | dict): a key's images, sprite sheet frames included
+    """
+    for obj in _tree(images):
+        if isinstance(obj, Surface):
+            _masks[obj] = mask.from_surface(obj)
+
+
+def _tree(value: Surface | list | dict) -> list:
+    """Flatten a loaded key's images and the lists and dicts holding them into a list"""
+    if isinstance(value, Surface):
+        return [value]
+    items = value.values() if isinstance(value, dict) else value
+    return [value, *(obj for item in items for obj in _tree(item))]
+
+
+def _evict() -> None:
+    """Drop least recently used keys that nothing holds until under the byte budget"""
+    total: int = sum(_sprite_bytes.values())
+    # the most recent key is the one being asked for
+    for key in list(_sprite_images)[:-1]:
+        if total <= _byte_budget:
+            break
+        if not _holds.get(key):
+            del _sprite_images[key]
+            total -= _sprite_bytes.pop(key)
+
+
+def _load_key(key: str) -> None:
+    """Load every image stored under a top level key
+
+    Args:
+        key (str): images key (filename)
+
+    Raises:
+        KeyError: no png uses the key
+    """
+    imgs_dict: dict = {}
+    if bake.is_loaded():
+        prepared: list = [bake.entry(i) for i, _ in _index[key]]
+        prepared = [(convert(img), rects) for img, rects in prepared]
+    else:
+        prepared = _prepare_all([spec for _, spec in _index[key]])
+
+    for (_, spec), (img, rects) in zip(_index[key], prepared):
+        _insert(imgs_dict, spec, img, rects)
+
+    _sprite_images[key] = imgs_dict[key]
+    _get_masks(imgs_dict[key])
+    _sprite_bytes[key] = sum(
+        obj.get_pitch() * obj.get_height()
+        for obj in _tree(imgs_dict[key])
+        if isinstance(obj, Surface)
+    )
+    _evict()
+
+
 def init() -> None:
-    _load(_images_directory, _sprite_images)
+    """
+    Index every image and map the baked cache, rebuilding it if it is stale.
+    Images themselves are loaded on first use by get_image or prefetch
+    """
+    specs: list = _scan(_images_directory)
+
+    if not bake.load(specs):
+        bake.write(specs, _prepare_all(specs))
+        bake.load(specs)
 
+    _sprite_images.clear()
+    _sprite_bytes.clear()
+    _holds.clear()
+    _palettes.clear()
+    _index.clear()
+    for i, spec in enumerate(specs):
+        _index.setdefault(spec.keys[0], []).append((i, spec))
 
-def get_image(key: str) -> Surface | dict:
-    """Return img surface object or dict with all of the surface's pngs
+
+def prefetch(keys: tuple[str]) -> None:
+    """Load keys ahead of time, e.g. the images a screen is about to use
+
+    Args:
+        keys (tuple[str]): images keys (filenames)
+    """
+    for key in keys:
+        if key in _sprite_images:
+            _sprite_images.move_to_end(key)
+        else:
+            _load_key(key)
+
+
+def hold(keys: tuple[str]) -> None:
+    """Load keys and keep them from being evicted until they are released,
+       e.g. by a screen for as long as it's kept around
+
+    Args:
+        keys (tuple[str]): images keys (filenames)
+    """
+    for key in keys:
+        _holds[key] = _holds.get(key, 0) + 1
+    prefetch(keys)
+
+
+def release(keys: tuple[str]) -> None:
+    """Undo a hold, keys nothing holds anymore may be evicted.
+       Anything still referencing their images keeps them alive,
+       evicting only means they get loaded again when asked for
+
+    Args:
+        keys (tuple[str]): images keys (filenames)
+    """
+    for key in keys:
+        if (count := _holds.get(key, 0) - 1) > 0:
+            _holds[key] = count
+        else:
+            _holds.pop(key, None)
+    _evict()
+
+
+def get_image(key: str, writable: bool = False) -> Surface | list | dict:
+    """Return img surface object or dict with all of the surface's pngs.
+       Images are shared by every caller and must not be drawn onto,
+       use with_alpha for per sprite alpha or ask for a writable copy
 
     Args:
         key (str): images key (filename)
+        writable (bool, optional): return private copies that can be drawn onto. Defaults to False.
 
     Raises:
         KeyError | ValyeError: Invalid key
 
     Returns:
-        Surface or dict: a single image or a dict containing images
+        Surface, list or dict: a single image, a list of images or a dict containing images
     """
     try:
+        prefetch((key,))
+        if not writable:
+            return _sprite_images[key]
         if isinstance(sub_dict := _sprite_images[key], dict):
             copy_dict: dict = {}
             for subkey in sub_dict:
                 copy_dict[subkey] = [surf.copy() for surf in sub_dict[subkey]]
             return copy_dict
+        elif isinstance(_sprite_images[key], list):
+            return [surf.copy() for surf in _sprite_images[key]]
         else:
             return _sprite_images[key].copy()
     except (KeyError, ValueError) as ex:
         raise ex.with_traceback()
 
 
+def with_alpha(surf: Surface, alpha: int) -> Surface:
+    """Get a shared image drawn at an alpha without touching the image itself
+
+    Args:
+        surf (Surface): shared image from get_image
+        alpha (int): 0 - 255
+
+    Returns:
+        Surface: surf itself at full alpha, otherwise a cached copy with the alpha set
+    """
+    if alpha >= 255:
+        return surf
+    variants: dict = _alpha_variants.setdefault(surf, {})
+    if (variant := variants.get(alpha)) is None:
+        variant = variants[alpha] = surf.copy()
+        variant.set_alpha(alpha)
+    return variant
+
+
+def get_mask(surf: Surface) -> Mask:
+    """Get the collision mask of a shared image, built when its key was loaded
+
+    Args:
+        surf (Surface): shared image from get_image
+
+    Returns:
+        Mask: set where the image isn't its colorkey
+    """
+    if (_mask := _masks.get(surf)) is None:
+        _mask = _masks[surf] = mask.from_surface(surf)
+    return _mask
+
+
+def get_font(name: str = None, size: int = 24, bold: bool = False) -> font.Font:
+    """Return a system font, resolved and loaded once per process
+
+    Args:
+        name (str, optional): system font name. Defaults to pygame's default font.
+        size (int, optional): point size. Defaults to 24.
+        bold (bool, optional): Defaults to False.
+
+    Returns:
+        font.Font: shared font object
+    """
+    key: tuple = (name, size, bold)
+    if (_font := _fonts.get(key)) is None:
+        _font = _fonts[key] = font.SysFont(name, size, bold=bold)
+    return _font
+
+
+def render_text(
+    text: str,
+    size: int,
+    color: tuple,
+    background: tuple = None,
+    name: str = None,
+    bold: bool = False,
+) -> Surface:
+    """Return antialiased text, rendered once and shared by every caller like get_image
+
+    Args:
+        text (str): text to render
+        size (int): point size of the font
+        color (tuple): text color
+        background (tuple, optional): background color. Defaults to transparent.
+        name (str, optional): system font name. Defaults to pygame's default font.
+        bold (bool, optional): Defaults to False.
+
+    Returns:
+        Surface: rendered text, must not be drawn onto
+    """
+    key: tuple = (text, name, size, bold, tuple(color), background and tuple(background))
+    if (surf := _texts.get(key)) is not None:
+        _texts.move_to_end(key)
+        return surf
+
+    surf = _texts[key] = get_font(name, size, bold).render(text, True, color, background)
+    if len(_texts) > _text_capacity:
+        _texts.popitem(last=False)
+    return surf
+
+
+def _extract_palette(img: Surface) -> tuple:
+    """Grab the colors an image is made of, leaving out black and white
+
+    Args:
+        img (Surface): pygame Surface
+
+    Returns:
+        tuple: [r, g, b, 255] colors in the order they first appear
+        column by column, then sorted from darkest(0) to lightest(n)
+    """
+    pixels = surfarray.array3d(img).reshape(-1, 3).astype(np.uint32)
+    packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+
+    values, first = np.unique(packed, return_index=True)
+    keep = (values != 0x000000) & (values != 0xFFFFFF)
+    values = values[keep][np.argsort(first[keep])]
+
+    rgb = np.stack(((values >> 16) & 255, (values >> 8) & 255, values & 255), axis=1)
+    rgb = rgb[np.argsort(rgb.sum(axis=1), kind="stable")]
+    return tuple([int(r), int(g), int(b), 255] for r, g, b in rgb)
+
+
+def get_palette(key: str, *subkeys: str | int) -> tuple:
+    """Return the colors of an image, extracted once and kept in the baked cache
+
+    Args:
+        key (str): images key (filename)
+        subkeys (str | int): keys or indexes leading to a single image, e.g. "idle", 0
+
+    Returns:
+        tuple: [r, g, b, 255] colors sorted from darkest(0) to lightest(n)
+    """
+    name: str = "/".join(str(k) for k in (key, *subkeys))
+    if (palette := _palettes.get(name)) is None:
+        if (palette := bake.get_palette(name)) is None:
+            img = get_image(key)
+            for subkey in subkeys:
+                img = img[subkey]
+            palette = _extract_palette(img)
+            bake.store_palette(name, palette)
+        palette = _palettes[name] = tuple(palette)
+    return palette
+
+
 if __name__ == "__main__":
     init()
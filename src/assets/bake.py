@@ -0,0 +1,204 @@
+"""
+Pre-baked sprite cache.
+
+Decoded, scaled and colorkeyed images are written as raw pixel buffers to
+a single file next to a json manifest of their sizes, colorkeys and
+sprite sheet sub-rects, along with the color palettes ships build their
+death particles from. At startup the file is memory mapped and images are
+turned back into surfaces with image.frombuffer as they are needed,
+skipping png decoding entirely.
+The cache is rebuilt whenever a source png's mtime or hash changes.
+
+Build it ahead of time with: python -m src.assets.bake
+"""
+import hashlib
+import json
+import mmap
+import os
+
+from pygame import Rect, Surface, image
+
+
+# bump when the layout of the cache changes
+_version: int = 1
+_pixel_format: str = "RGB"
+
+_cache_directory: str = os.path.abspath(os.path.join(os.getcwd(), "images", ".cache"))
+_pixels_path: str = os.path.join(_cache_directory, "sprites.bin")
+_manifest_path: str = os.path.join(_cache_directory, "sprites.json")
+
+# surfaces made with frombuffer point into this map, so it stays open
+_pixels: mmap.mmap = None
+# manifest of the mapped cache
+_manifest: dict = {"entries": [], "palettes": {}}
+
+
+def _hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def _fingerprint(path: str) -> dict:
+    """mtime, size and hash of a source png"""
+    stat = os.stat(path)
+    return {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha1": _hash(path)}
+
+
+def _is_current(specs: list, manifest: dict) -> bool:
+    """Check the manifest was built from exactly these pngs
+
+    Args:
+        specs (list): specs of the pngs on disk
+        manifest (dict): loaded manifest
+
+    Returns:
+        bool: False if a png was added, removed or changed
+    """
+    if manifest.get("version") != _version:
+        return False
+
+    sources: dict = manifest["sources"]
+    if [spec.path for spec in specs] != [entry["path"] for entry in manifest["entries"]]:
+        return False
+
+    touched: bool = False
+    for spec in specs:
+        stat = os.stat(spec.path)
+        source: dict = sources[spec.path]
+        if source["mtime"] == stat.st_mtime_ns and source["size"] == stat.st_size:
+            continue
+        # a newer mtime alone doesn't mean the pixels changed
+        if source["sha1"] != _hash(spec.path):
+            return False
+        source["mtime"], source["size"] = stat.st_mtime_ns, stat.st_size
+        touched = True
+
+    if touched:
+        _write_manifest(manifest)
+    return True
+
+
+def _write_manifest(manifest: dict) -> None:
+    with open(_manifest_path, "w") as file:
+        json.dump(manifest, file)
+
+
+def load(specs: list) -> bool:
+    """Map the cache so its images can be read with entry
+
+    Args:
+        specs (list): specs of the pngs on disk, in scan order
+
+    Returns:
+        bool: False if the cache is missing or stale
+    """
+    global _pixels, _manifest
+
+    try:
+        with open(_manifest_path) as file:
+            manifest: dict = json.load(file)
+        if not _is_current(specs, manifest):
+            return False
+
+        with open(_pixels_path, "rb") as file:
+            # copy on write so nothing drawing onto a surface can reach the file
+            pixels = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError, KeyError):
+        return False
+
+    manifest.setdefault("palettes", {})
+    _pixels, _manifest = pixels, manifest
+    return True
+
+
+def is_loaded() -> bool:
+    return _pixels is not None
+
+
+def entry(index: int) -> tuple[Surface, list]:
+    """Read one prepared image from the mapped cache
+
+    Args:
+        index (int): position of the image's spec in scan order
+
+    Returns:
+        tuple[Surface, list]: the image and the sub-rects of a sprite sheet or None
+    """
+    _entry: dict = _manifest["entries"][index]
+    img: Surface = image.frombuffer(
+        memoryview(_pixels)[_entry["offset"] : _entry["offset"] + _entry["length"]],
+        tuple(_entry["size"]),
+        _pixel_format,
+    )
+    img.set_colorkey(_entry["colorkey"])
+    return (img, [Rect(rect) for rect in _entry["rects"]] if _entry["rects"] else None)
+
+
+def write(specs: list, prepared: list[tuple[Surface, list]]) -> None:
+    """Write prepared images to the cache
+
+    Args:
+        specs (list): specs of the pngs on disk, in scan order
+        prepared (list[tuple[Surface, list]]): an (image, sub-rects) pair per spec
+    """
+    entries: list = []
+    offset: int = 0
+    try:
+        os.makedirs(_cache_directory, exist_ok=True)
+        # written next to the cache and swapped in, so a mapped old cache stays valid
+        with open(_pixels_path + ".tmp", "wb") as file:
+            for spec, (img, rects) in zip(specs, prepared):
+                data: bytes = image.tostring(img, _pixel_format)
+                file.write(data)
+                entries.append(
+                    {
+                        "path": spec.path,
+                        "offset": offset,
+                        "length": len(data),
+                        "size": list(img.get_size()),
+                        "colorkey": list(img.get_colorkey() or img.get_at((0, 0))),
+                        "rects": [list(rect) for rect in rects] if rects else None,
+                    }
+                )
+                offset += len(data)
+        os.replace(_pixels_path + ".tmp", _pixels_path)
+
+        _write_manifest(
+            {
+                "version": _version,
+                "sources": {spec.path: _fingerprint(spec.path) for spec in specs},
+                "entries": entries,
+                "palettes": {},
+            }
+        )
+    except OSError as ex:
+        print(f"could not write the sprite cache: {ex}")
+
+
+def get_palette(name: str) -> list:
+    """Palette stored in the mapped cache by a previous run, or None"""
+    return _manifest["palettes"].get(name)
+
+
+def store_palette(name: str, palette: list) -> None:
+    """Keep a palette in the cache so later runs can skip extracting it
+
+    Args:
+        name (str): image the palette belongs to
+        palette (list): [r, g, b, a] colors
+    """
+    if not is_loaded():
+        return
+    _manifest["palettes"][name] = palette
+    try:
+        _write_manifest(_manifest)
+    except OSError as ex:
+        print(f"could not write the sprite cache: {ex}")
+
+
+if __name__ == "__main__":
+    from .assets import _scan, _prepare_all, _images_directory
+
+    _specs: list = _scan(_images_directory)
+    write(_specs, _prepare_all(_specs))
+    print(f"baked {len(_specs)} images into {_pixels_path}")
@@ -1,10 +1,10 @@
 import traceback
 
-from pygame import Surface, Rect, font
+from pygame import Color, Surface, Rect
 from typing import Sequence, Tuple, Union
 
 from .screenbase import ScreenBase
-from ..assets import get_image
+from ..assets import get_image, render_text, with_alpha, convert_alpha
 from ..settings import width, height
 
 
@@ -13,6 +13,12 @@ class MenuBase(ScreenBase):
     _button_positions: list = [(width / 2, (height / 8) * (i + 3)) for i in range(4)]
     _row: int = height / 8
     _button_images: list = list()
+    # what the title and buttons are drawn over
+    background_color: tuple = (0, 0, 0)
+    # only changes when a button is pressed
+    static: bool = True
+
+    assets: tuple = ("buttons",)
 
     @property
     def row(self) -> int:
@@ -25,7 +31,56 @@ class MenuBase(ScreenBase):
 
         self.title, self.title_rect = self.create_title(title)
         self.buttons: list[Button] = self.create_image_buttons(buttons)
-        self.button_blit_seq = self._get_blitseq(self.buttons)
+        # the whole image has to be recomposed
+        self.__stale: bool = True
+
+    @property
+    def button_blit_seq(self) -> Sequence[Tuple[Surface, Rect]]:
+        """the buttons' current images, a pressed button is drawn faded"""
+        return self._get_blitseq(self.buttons)
+
+    def reset(self) -> None:
+        """override"""
+        super().reset()
+        for button in self.buttons:
+            button.reset_alpha()
+        self.__stale = True
+
+    def invalidate(self) -> None:
+        """recompose the whole image on the next update"""
+        self.__stale = True
+
+    def compose(self) -> None:
+        """
+        redraw whatever changed since the menu was last composed,
+        an untouched menu is left as it is
+        """
+        if self.__stale:
+            # the old layout is forgotten, the fill covers it
+            self.dirty.erase(self.image, self.background_color)
+            self.image.fill(self.background_color)
+            if Color(self.background_color) != self.image.get_colorkey():
+                # a tinted background is part of what's drawn
+                self.dirty.add(self.rect)
+            self.dirty.add(self.image.blit(self.title, self.title_rect))
+            self.dirty.extend(self.image.blits(self.button_blit_seq))
+            for button in self.buttons:
+                button.changed = False
+            self.__stale = False
+            self.dirty.invalidate()
+            return
+
+        for button in self.buttons:
+            if button.changed:
+                self.image.fill(self.background_color, button.rect)
+                self.dirty.mark(self.image.blit(button.image, button.rect))
+                button.changed = False
+
+    def update(self) -> None:
+        self.compose()
+
+    def render(self, alpha: float = 1.0) -> None:
+        """override - the image only changes when compose redraws it"""
 
     def _get_blitseq(self, seq: list[any]) -> Sequence[Tuple[Surface, Rect]]:
         """
@@ -43,8 +98,7 @@ class MenuBase(ScreenBase):
 
     def create_title(self, title: str) -> tuple[Surface, Rect]:
         """Create menu title text"""
-        _font = font.SysFont(None, 80, bold=True)
-        title_image = _font.render(title, True, (255, 255, 255))
+        title_image = render_text(title, 80, (255, 255, 255), bold=True)
         title_rect = title_image.get_rect()
         title_rect.centerx = width / 2
         title_rect.centery = self._row * 2
@@ -71,6 +125,9 @@ class Button:
     image: Surface = None
     rect: Rect = None
     name: str = None
+    alpha: int = 255
+    # image changed since the menu last drew it
+    changed: bool = True
 
     def __init__(
         self,
@@ -88,7 +145,7 @@ class Button:
         """
         self.width, self.height = size
 
-        self.image = Surface(size).convert_alpha()
+        self.image = convert_alpha(Surface(size))
         self.image.fill((144, 144, 144, 255))
         self.rect = self.image.get_rect()
         self.name = button_text
@@ -104,14 +161,14 @@ class Button:
         bg_color=(144, 144, 144, 255),
     ):
         """set the buttons msg_text and msg_text_rect"""
-        text_font = font.SysFont(None, font_size, bold=True)
-        msg_image = text_font.render(text, True, text_color, bg_color)
+        msg_image = render_text(text, font_size, text_color, bg_color, bold=True)
         offset = (
             int((self.rect.width - msg_image.get_width()) / 2),
             int((self.rect.height - msg_image.get_height()) / 2),
         )
         self.image.fill(bg_color)
         self.image.blit(msg_image, offset)
+        self.changed = True
 
     def check_button(self, mouse_pos, mouse_up: bool = False) -> bool:
         """check for button collision"""
@@ -120,21 +177,26 @@ class Button:
             # if the mouse button was released over the button
             # and the button was the one pressed down on
             if mouse_up:
-                if self.image.get_alpha() < 255:
+                if self.alpha < 255:
                     self.reset_alpha()
                     return True
                 # if the mouse button was release over this button
                 # but a different button was clicked
                 return False
             else:
-                self.image.set_alpha(25)
+                self.set_alpha(25)
         # if user releases the mouse button and this button
         # was the one that was pressed
         elif mouse_up:
             self.reset_alpha()
 
+    def set_alpha(self, alpha: int):
+        self.changed = self.changed or alpha != self.alpha
+        self.alpha = alpha
+        self.image.set_alpha(alpha)
+
     def reset_alpha(self):
-        self.image.set_alpha(255)
+        self.set_alpha(255)
 
     def set_position(self, x_pos: Union[int, tuple] = None, y_pos: int = None):
         """Set the position of the rect"""
@@ -154,7 +216,8 @@ class ImageButton(Button):
 
     @property
     def image(self) -> Surface:
-        return self.__image
+        """the shared button image at this button's alpha"""
+        return with_alpha(self.__image, self.alpha)
 
     @image.setter
     def image(self, val: Surface):
@@ -176,6 +239,16 @@ class ImageButton(Button):
             traceback.print_stack()
             raise TypeError(f"TypeError: Value -> {val} not an integer!")
 
+    def set_alpha(self, alpha: int):
+        """override - button images are shared between menus"""
+        self.changed = self.changed or alpha != self.alpha
+        self.alpha = alpha
+
+    def set_text(self, *args, **kwargs):
+        """override - draw onto a private copy of the shared image"""
+        self.image = self.__image.copy()
+        super().set_text(*args, **kwargs)
+
     def __init__(self, img: Surface, key: int, pos: tuple) -> None:
         self.image = img
         self.rect = self.image.get_rect()
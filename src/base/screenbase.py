@@ -1,4 +1,6 @@
 from ..settings import size
+from ..assets import convert_alpha
+from ..dirty import DirtyRects
 
 from abc import ABCMeta
 from pygame import Surface
@@ -17,14 +19,40 @@ class ScreenBase(metaclass=ABCMeta):
     next_screen: str = "main_menu"
 
     width, height = size
+    # share of State's screen cache budget this screen takes up
+    cache_weight: int = 1
+    # image keys the screen uses, loaded before it becomes active
+    assets: tuple = ()
+    # nothing on the screen moves until there is input, the main loop idles
+    static: bool = False
 
     CHANGESCREEN: int = event.custom_type()
     PAUSE: int = event.custom_type()
 
     def __init__(self) -> None:
-        self.image = Surface(size).convert_alpha()
+        self.image = convert_alpha(Surface(size))
         self.image.set_colorkey((0, 0, 0))
         self.rect = self.image.get_rect()
+        self.dirty = DirtyRects(self.rect)
+
+    def reset(self) -> None:
+        """
+        put a cached screen back into the state it was built in
+        so it can be reused instead of reconstructed
+        """
+        self.dirty.invalidate()
+
+    def render(self, alpha: float = 1.0) -> None:
+        """
+        draw the screen's image for the current frame
+        and record the regions that changed in self.dirty.
+        The image is see-through outside what dirty.drawn holds.
+        Screens that don't track regions get repainted whole
+        alpha: float -> progress between the last two simulation ticks
+        """
+        self.dirty.invalidate()
+        if not self.dirty.drawn:
+            self.dirty.add(self.rect)
 
     @classmethod
     def __subclasshook__(cls, subclass):
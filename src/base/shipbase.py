@@ -1,213 +1,108 @@
-from pygame import Surface, sprite, surfarray
-from pygame import event, Vector2, time
+from pygame import Rect, Surface, mask, sprite
 
 from typing import Union
 
 from ..settings import size
 from ..sprites import Laser
+from ..assets import get_mask, with_alpha
+from ..systems.entities import Component
 
 
 class ShipBase(sprite.Sprite):
     """
-    A base class for all of the ship sprites
+    A base class for all of the ship sprites.
+    Its state lives in the level's EntityRegistry once the level files it
     """
 
-    health: int = 1
-    base_speed: float = 5.5
-    movement_speed: float = 5.5
-    alpha: int = 255
-    alpha_switch: int = 1
-    alpha_counter: int = 1
+    # center of the ship's rect
+    x = Component("positions", 0.0, index=0)
+    y = Component("positions", 0.0, index=1)
+    health = Component("health", 1)
+    base_speed = Component("base_speed", 5.5)
+    movement_speed = Component("movement_speed", 5.5)
+    alpha = Component("alpha", 255)
+    # alpha the ship is drawn at, the shared image itself is never changed
+    image_alpha = Component("image_alpha", 255)
+    alpha_switch = Component("alpha_switch", 1)
+    alpha_counter = Component("alpha_counter", 1)
+    damaged = Component("damaged", False)
+    dying = Component("dying", False)
+    # id of the ship's explosion in the level's ParticleEngine, -1 before it explodes
+    burst = Component("burst", -1)
+    base_image = Component("images")
 
     side_switch: bool = True
-    damaged: bool = False
-    dying: bool = False
-
-    def __init__(self, image_: Surface, health_: int, events_: list[event.Event] = []):
+    # how the level's Steering moves the ship, see Steering.behaviours
+    behaviour: str = "track"
+    # EntityRegistry holding the ship's components and the ship's row in it
+    registry = None
+    row: int = None
+    # ProjectileEngine and Scheduler of the level the ship is in, set by the level
+    projectiles = None
+    scheduler = None
+
+    def __init__(self, image_: Surface, health_: int):
         super().__init__()
         self.screen_size = size
         self.health = health_
-        self.events: list[event.Event] = events_
+        # handles of the ship's scheduled callbacks
+        self.timers: list = []
         self.image: Surface = image_
-        self.rect = self.image.get_rect()
-        self.x, self.y = float(self.rect.centerx), float(self.rect.centery)
+        rect = self.image.get_rect()
+        self.x, self.y = float(rect.centerx), float(rect.centery)
 
-        self.lasers = sprite.Group()
+    @property
+    def image(self) -> Surface:
+        """the ship's shared image at the ship's own alpha"""
+        return with_alpha(self.base_image, self.image_alpha)
 
-    def __generate_particles(self) -> list:
-        """
-        Use class's colors var and generate a list of particles
-        """
-        particles: list = []
-        for n, color in enumerate(self.colors):
-            particles.append(
-                _Particle(
-                    color=color,
-                    radius=(self.rect.w / 4) - n,
-                    velocity=0.8 * (n + 1),
-                    offset=(n, n),
-                    center=self.rect.center,
-                )
-            )
-        return particles
-
-    def __animate(self) -> None:
-        """
-        slow movement and osc alpha when hit
-        """
-        self.alpha += 50 * self.alpha_switch
+    @image.setter
+    def image(self, image_: Surface) -> None:
+        self.base_image = image_
 
-        if not 0 <= self.alpha <= 255:
-            self.alpha_switch *= -1
-            self.alpha_counter += 1
-            self.alpha += 100 * self.alpha_switch
+    @property
+    def rect(self) -> Rect:
+        """the ship's rect, centered on its position"""
+        return self.base_image.get_rect(center=(int(self.x), int(self.y)))
 
-            if self.alpha_counter == 6:
-                self._recover()
-            self.image.set_alpha(self.alpha)
-
-    def _get_sprite_colors(self, img: Surface) -> tuple:
-        """
-        Loop through a surface and grab the colors its made of
-        sort from lightest(n) to darkest(0)
-        """
-        colors: list = []
-        for row in surfarray.array3d(img):
-            for pixel in row:
-                rgb: list = [int(pixel[0]), int(pixel[1]), int(pixel[2]), 255]
-                if rgb not in [[255, 255, 255, 255], [0, 0, 0, 255]] + colors:
-                    colors.append(rgb)
-        colors.sort(key=sum)
-        return tuple(colors)
-
-    def _track(self, start: int, dest: int, speed: int = 40) -> float:
-        """
-        calculate a gradual movement from
-        start ---> dest
-        increase speed variable to track slower
-        decrease to track faster
-        """
-        return (dest - start) / speed
+    @property
+    def mask(self) -> mask.Mask:
+        """collision mask of the ship's current image, shared with every ship using it"""
+        return get_mask(self.base_image)
 
     def _recover(self, health_: int = 0) -> None:
         """
         reset after being damaged
         """
-        self.dying = False
-        self.damaged = False
-        self.alpha_counter = 1
-        self.alpha = 255
-        self.movement_speed = self.base_speed * (
-            self.movement_speed / abs(self.movement_speed)
-        )
-        self.image.set_alpha(self.alpha)
+        self.registry.recover(self.row)
         if health_ > 0:
             self.health = health_
 
     def _create_laser(self, direction: int, pos_y: int) -> None:
         """
-        create lasers and add it to the group
+        fire a laser from alternating wings
         """
-        laser: Laser = Laser(direction)
-
         left_wing_position: int = self.rect.x + 13
         right_wing_position: int = self.rect.x + (self.rect.width - 18)
 
         if self.side_switch:
-            laser.set_position(left_wing_position, pos_y)
+            self.projectiles.fire(Laser, direction, left_wing_position, pos_y)
             self.side_switch = False
         else:
-            laser.set_position(right_wing_position, pos_y)
+            self.projectiles.fire(Laser, direction, right_wing_position, pos_y)
             self.side_switch = True
 
-        self.lasers.add(laser)
+    def _schedule(self, delay: int, callback: callable, repeat: bool = False) -> None:
+        """run callback on the level's scheduler until the ship's timers are cancelled"""
+        self.timers = [timer for timer in self.timers if timer.active]
+        self.timers.append(self.scheduler.schedule(delay, callback, repeat))
 
-    def take_damage(self, value) -> None:
-        """
-        Reduce player health and set bool
-        """
-        if not self.dying:
-            self.health -= value
-            if self.health <= 0:
-                self.dying = True
-                self.color_particles = self.__generate_particles()
-                for event_ in self.events:
-                    time.set_timer(event_, 0)
-                    event.clear(event_.type)
-            else:
-                self.damaged = True
-                self.movement_speed /= 2
+    def cancel_timers(self) -> None:
+        """stop the ship's timers"""
+        for timer in self.timers:
+            timer.cancel()
+        self.timers = []
 
     def set_position(self, x: float, y: float) -> None:
         """set player positions"""
         self.x, self.y = x, y
-        self.rect.centerx, self.rect.centery = int(self.x), int(self.y)
-
-    def update_particles(self) -> None:
-        for particle in self.color_particles:
-            particle.update()
-
-    def update(self) -> None:
-        """Update damaged animation if ship is damaged"""
-        if self.damaged:
-            self.__animate()
-
-
-class _Particle:
-
-    directions: tuple = (
-        # left
-        (-1, 0),
-        # right
-        (1, 0),
-        # up
-        (0, -1),
-        # down
-        (0, 1),
-        # top left
-        (-1, -1),
-        # bottom left
-        (-1, 1),
-        # top right
-        (1, -1),
-        # bottom right
-        (1, 1),
-    )
-
-    def __init__(
-        self,
-        color: tuple,
-        radius: int,
-        velocity: float,
-        offset: tuple,
-        center: tuple[int, int],
-    ):
-
-        self.color: list = list(color)
-        self.radius: int = radius
-        self.velocity: float = velocity
-        self.offset: tuple = offset
-        self.alpha: float = 255.0
-
-        self.positions: list = [Vector2((0, 0)) for _ in self.directions]
-        for i, position in enumerate(self.positions):
-            position.x = int(center[0] + (self.offset[0] * self.directions[i][0]))
-            position.y = int(center[1] + (self.offset[1] * self.directions[i][1]))
-
-    def update(self):
-        """
-        Move the particle
-        Lower the alpha
-        Lower the radius
-        """
-        for i in range(len(self.positions)):
-            self.positions[i].x += int(self.velocity * self.directions[i][0])
-            self.positions[i].y += int(self.velocity * self.directions[i][1])
-
-        if 15.0 < self.alpha <= 255.0:
-            self.alpha -= self.velocity
-        else:
-            self.alpha = 0.0
-
-        self.color[3] = int(self.alpha)
-        self.radius -= 0.2
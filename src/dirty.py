@@ -0,0 +1,79 @@
+from pygame import Rect, Surface
+
+
+class DirtyRects:
+    """
+    Tracks the regions of a surface that changed since they
+    were last pushed to the display.
+    Whatever was drawn is erased again on the next erase call,
+    so both the old and the new spot of a moving sprite get reported
+    """
+
+    # past this share of the bounds a single full update is cheaper
+    full_ratio: float = 0.5
+    # past this many rects a single full update is cheaper
+    max_rects: int = 200
+
+    def __init__(self, bounds: Rect) -> None:
+        """
+        bounds: Rect -> area of the surface being tracked
+        """
+        self.bounds = Rect(bounds)
+        self.__area: int = self.bounds.w * self.bounds.h
+        # drawn since the last erase
+        self.__drawn: list = []
+        # changed since the last flush
+        self.__pending: list = []
+        self.__full: bool = True
+
+    @property
+    def drawn(self) -> list[Rect]:
+        """regions drawn since the last erase"""
+        return self.__drawn
+
+    def invalidate(self) -> None:
+        """mark the whole surface as changed"""
+        self.__full = True
+
+    def add(self, rect: Rect) -> None:
+        """record a region that was drawn to"""
+        self.__drawn.append(rect)
+        self.__pending.append(rect)
+
+    def mark(self, rect: Rect) -> None:
+        """record a region that changed but stays drawn until it's redrawn"""
+        self.__pending.append(rect)
+
+    def extend(self, rects: list) -> None:
+        for rect in rects:
+            self.add(rect)
+
+    def erase(self, surface: Surface, color: tuple) -> None:
+        """fill everything drawn since the last erase with color"""
+        if len(self.__drawn) > self.max_rects:
+            # one fill beats hundreds, and the flush would be a full update anyway
+            surface.fill(color, self.bounds)
+            self.__full = True
+        else:
+            for rect in self.__drawn:
+                surface.fill(color, rect)
+            self.__pending.extend(self.__drawn)
+        self.__drawn = []
+
+    def flush(self) -> list[Rect]:
+        """return the changed regions and start collecting again"""
+        if self.__full or len(self.__pending) > self.max_rects:
+            self.__full = False
+            self.__pending = []
+            return [self.bounds.copy()]
+
+        rects: list = [rect for rect in self.__pending if rect.w and rect.h]
+        self.__pending = []
+
+        if sum(rect.w * rect.h for rect in rects) > self.__area * self.full_ratio:
+            return [self.bounds.copy()]
+        return rects
+
+    def is_full(self, rects: list[Rect]) -> bool:
+        """check if a flushed list covers the whole surface"""
+        return len(rects) == 1 and rects[0] == self.bounds
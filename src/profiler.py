@@ -0,0 +1,148 @@
+import csv
+import json
+
+import numpy as np
+
+from contextlib import nullcontext
+from time import perf_counter
+from pygame import Rect, Surface, SRCALPHA
+
+from .assets import get_font
+
+
+class _Phase:
+    """context manager that adds its elapsed time to a column of the current frame"""
+
+    def __init__(self, profiler: "FrameProfiler", column: int) -> None:
+        self.profiler = profiler
+        self.column = column
+        self.start: float = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *_) -> None:
+        self.profiler.current[self.column] += (perf_counter() - self.start) * 1000
+
+
+class FrameProfiler:
+    """
+    Times each phase of the main loop and keeps the
+    last capacity frames in a fixed size ring buffer
+    """
+
+    phases: tuple = ("events", "background", "screen", "draw", "flip", "idle")
+    # phases left out of the whole frame time, waiting for input isn't work
+    excluded: tuple = ("idle",)
+    percentiles: tuple = (50, 95, 99)
+    # frames between refreshes of the overlay text
+    overlay_interval: int = 30
+    overlay_size: tuple = (430, 18 * (len(phases) + 1) + 10)
+
+    def __init__(self, capacity: int = 1200, enabled: bool = True) -> None:
+        """
+        capacity: int -> number of frames kept,
+        enabled: bool -> when False phases are not timed at all
+        """
+        self.enabled: bool = enabled
+        self.show_overlay: bool = False
+        # one row per frame, one column per phase and the whole frame,
+        # without the excluded phases, last
+        self.samples = np.zeros((capacity, len(self.phases) + 1), dtype=np.float32)
+        self.current = np.zeros(len(self.phases) + 1, dtype=np.float32)
+        self.index: int = 0
+        self.count: int = 0
+
+        self.__timers: dict = {
+            name: _Phase(self, column) for column, name in enumerate(self.phases)
+        }
+        self.__excluded: list = [self.phases.index(name) for name in self.excluded]
+        self.__frame_start: float = perf_counter()
+        self.__overlay: Surface = None
+        self.__overlay_age: int = 0
+
+    def phase(self, name: str):
+        """time the block inside a with statement as the named phase"""
+        if self.enabled:
+            return self.__timers[name]
+        return nullcontext()
+
+    def toggle_overlay(self) -> None:
+        self.show_overlay = not self.show_overlay
+        self.__overlay_age = self.overlay_interval
+
+    def end_frame(self) -> None:
+        """store the current frame in the ring buffer and start the next one"""
+        if not self.enabled:
+            return
+        now: float = perf_counter()
+        self.current[-1] = (now - self.__frame_start) * 1000 - self.current[self.__excluded].sum()
+        self.__frame_start = now
+
+        self.samples[self.index] = self.current
+        self.current[:] = 0.0
+        self.index = (self.index + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+
+    def frames(self) -> np.ndarray:
+        """recorded frames, oldest first"""
+        if self.count < len(self.samples):
+            return self.samples[: self.count]
+        return np.roll(self.samples, -self.index, axis=0)
+
+    def summary(self) -> dict:
+        """rolling percentiles in milliseconds for every phase and the whole frame"""
+        frames = self.frames()
+        if not len(frames):
+            return {}
+        values = np.percentile(frames, self.percentiles, axis=0)
+        return {
+            name: {f"p{p}": float(values[i][column]) for i, p in enumerate(self.percentiles)}
+            for column, name in enumerate((*self.phases, "frame"))
+        }
+
+    def draw_overlay(self, display: Surface) -> Rect:
+        """blit the percentile overlay to the top left of the display and return its rect"""
+        if not (self.enabled and self.show_overlay):
+            return None
+        self.__overlay_age += 1
+        if self.__overlay_age >= self.overlay_interval:
+            self.__overlay = self.__render_overlay()
+            self.__overlay_age = 0
+        return display.blit(self.__overlay, (8, 8))
+
+    def __render_overlay(self) -> Surface:
+        _font = get_font(None, 22)
+        lines: list = [
+            f"{name:>10} "
+            + " ".join(f"{key} {value:6.2f}" for key, value in stats.items())
+            for name, stats in self.summary().items()
+        ] or ["collecting..."]
+
+        images: list = [_font.render(line, True, (225, 225, 225)) for line in lines]
+        # fixed size so the overlay always covers the same display region
+        overlay = Surface(self.overlay_size, flags=SRCALPHA)
+        overlay.fill((10, 10, 10, 170))
+        for i, img in enumerate(images):
+            overlay.blit(img, (6, 5 + i * 18))
+        return overlay
+
+    def dump(self, path: str) -> None:
+        """write the recorded frames to a .csv file or any other path as json"""
+        frames = self.frames()
+        columns: list = [*self.phases, "frame"]
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(columns)
+                writer.writerows(frames.astype(float).round(4).tolist())
+        else:
+            with open(path, "w") as file:
+                json.dump(
+                    {
+                        "columns": columns,
+                        "summary": self.summary(),
+                        "frames": frames.astype(float).round(4).tolist(),
+                    },
+                    file,
+                )
@@ -1 +1 @@
-from .level import LevelOne
+from .states import Wave
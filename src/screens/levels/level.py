@@ -1,87 +1,143 @@
 import pygame
 
-from .states import LevelOne
+from .states import Wave
 from ...sprites import Player
 from ...base import ScreenBase
+from ...assets import get_mask
+from ... import timestep
+from ...systems import EntityRegistry, ParticleEngine, ProjectileEngine, Scheduler
 from ..menus.pause_menu import PauseMenu
 
 
 class Level(ScreenBase):
 
     paused: bool = False
+    # test lasers against the ships' masks once their rects overlap
+    pixel_perfect: bool = True
+    # owns a player, a formation of enemies and a pause menu
+    cache_weight: int = 4
+    assets: tuple = ("player", "enemy", "saucer", *PauseMenu.assets)
 
     def __init__(self) -> None:
         super().__init__()
-        self.state = LevelOne()
+        self.projectiles = ProjectileEngine()
+        # runs on the level's own clock, which stands still while paused
+        self.scheduler = Scheduler()
+        # every ship in play, the player included
+        self.registry = EntityRegistry()
+        self.state = Wave("level_one", self.projectiles, self.scheduler, self.registry)
         self.player = Player()
+        self.player.projectiles = self.projectiles
+        self.registry.add(self.player, ProjectileEngine.PLAYER)
+        self.particles = ParticleEngine()
+        self.pause_menu = PauseMenu()
+        # the level as it was when paused, shown under the pause menu
+        self.__frozen: pygame.Surface = None
+        self.__start()
 
+    def __start(self) -> None:
+        """place the player and hide the cursor for a new run"""
         self.player.set_position(
             self.width / 2 - self.player.rect.width / 2,
             self.height - self.player.rect.height,
         )
-
-        self.sprites = pygame.sprite.Group(self.player)
+        self.registry.spawn(self.player.row)
 
         pygame.mouse.set_visible(False)
 
-        self.pause_menu = PauseMenu()
+    def reset(self) -> None:
+        """override - start a new run with the same sprites"""
+        super().reset()
+        self.paused = False
+        self.__frozen = None
+        self.next_screen = ScreenBase.next_screen
+        self.image.fill((0, 0, 0))
+
+        self.scheduler.clear()
+        self.registry.clear()
+        self.state.reset()
+        self.player.reset()
+        self.particles.clear()
+        self.projectiles.clear()
+        self.pause_menu.reset()
+        self.__start()
 
     def __check_collisions(self):
         """check for collision between sprites"""
-        for enemy in self.state.group.sprites():
-            if enemy.health > 0:
-                if p_lasers := pygame.sprite.spritecollide(
-                    enemy, self.player.lasers, True
-                ):
-                    for laser in p_lasers:
-                        enemy.take_damage(laser.damage)
-
-            if e_lasers := pygame.sprite.spritecollide(self.player, enemy.lasers, True):
-                for laser in e_lasers:
-                    self.player.take_damage(laser.damage)
-                    if self.player.health <= 0:
-                        self.next_screen = "game_over"
-                        pygame.event.post(pygame.event.Event(self.CHANGESCREEN))
+        registry = self.registry
+        for row in registry.rows(ProjectileEngine.ENEMY).tolist():
+            for damage in self.projectiles.collide(
+                registry.rect(row), ProjectileEngine.PLAYER, self.__mask(row)
+            ):
+                self.__damage(row, damage)
+
+        row = self.player.row
+        # the player's row stays in play while it explodes, and catch up
+        # ticks can run after the killing hit before the screen changes
+        if not registry.active[row] or registry.dying[row]:
+            return
+        for damage in self.projectiles.collide(
+            registry.rect(row), ProjectileEngine.ENEMY, self.__mask(row)
+        ):
+            if self.__damage(row, damage):
+                self.next_screen = "game_over"
+                pygame.event.post(pygame.event.Event(self.CHANGESCREEN))
+
+    def __mask(self, row: int):
+        """the mask collisions with a registry row are narrowed by, if any"""
+        return get_mask(self.registry.images[row]) if self.pixel_perfect else None
+
+    def __damage(self, row: int, value: int) -> bool:
+        """
+        damage a registry row and blow its ship up if that killed it,
+        returns True when it did
+        """
+        if not self.registry.damage(row, value):
+            return False
+        ship = self.registry.entities[row]
+        ship.cancel_timers()
+        rect = self.registry.rect(row)
+        self.registry.burst[row] = self.particles.emit(rect.center, ship.colors, rect.w)
+        return True
+
+    def __snapshot(self):
+        """store where everything was before this tick moves it"""
+        self.registry.snapshot()
+        self.projectiles.snapshot()
+
+    def __cull(self):
+        """remove lasers that left the screen and ships that finished dying"""
+        self.projectiles.cull(self.height)
+        bursts = self.particles.burst[: self.particles.count]
+        for row in self.registry.finished(bursts).tolist():
+            # once every particle faded out the ship leaves play,
+            # lasers it still had in flight fly on until they hit or leave the screen
+            self.registry.remove(row)
 
     def __update(self):
-        """updates and displays game objects"""
+        """updates game objects by one tick"""
+        self.__snapshot()
+        self.scheduler.advance(timestep.step_ms)
+        self.particles.update()
         self.state.update(player_x=self.player.rect.centerx)
         self.__check_collisions()
 
-        for sprite in self.sprites:
-            if sprite.health > 0:
-                sprite.update(play_x=self.player.rect.centerx)
-            elif sprite.dying:
-                sprite.update_particles()
+        row = self.player.row
+        if self.registry.active[row] and self.registry.health[row] > 0:
+            self.player.update()
+            # damaged animation
+            self.registry.animate([row])
 
-    def __draw(self):
-        self.image.fill((0, 0, 0))
-        for sprite in [*self.sprites.sprites(), *self.state.group.sprites()]:
-            for laser in sprite.lasers:
-                if 0 - laser.rect.height < laser.rect.y < self.height:
-                    self.image.blit(laser.image, laser.rect)
-                else:
-                    laser.kill()
-
-            if sprite.health > 0:
-                self.image.blit(sprite.image, sprite.rect)
-            elif sprite.dying:
-                # switch to true if any particle still has an alpha > 0
-                visible: bool = False
-                for particle in sprite.color_particles:
-                    if particle.alpha > 20.0:
-                        visible = True
-                        for position in particle.positions:
-                            pygame.draw.circle(
-                                self.image,
-                                particle.color,
-                                position,
-                                particle.radius,
-                            )
-                # if all of the particles have an alpha
-                # less than zero remove sprite from all groups
-                if not visible:
-                    sprite.kill()
+        self.projectiles.update()
+        self.__cull()
+
+    def __draw(self, alpha: float = 1.0):
+        self.dirty.erase(self.image, (0, 0, 0))
+        self.dirty.extend(self.image.blits(self.projectiles.blit_sequence(alpha)))
+        self.dirty.extend(self.image.blits(self.registry.blit_sequence(alpha)))
+        positions, radii, colors = self.particles.visible()
+        for position, radius, color in zip(positions.tolist(), radii.tolist(), colors.tolist()):
+            self.dirty.add(pygame.draw.circle(self.image, color, position, radius))
 
     def __player_keydown_controller(self, event):
         """respond to player inputs"""
@@ -124,25 +180,42 @@ class Level(ScreenBase):
         elif event.type == pygame.KEYUP:
             self.__player_keyup_controller(event)
 
-        else:
-            self.state.check_events(event)
-
+        # the scheduler isn't advanced while paused, so its timers wait
         if event.type == self.PAUSE:
             if self.paused:
-                self.state.unpause()
                 self.paused = False
+                self.__frozen = None
                 pygame.mouse.set_visible(False)
             else:
-                self.state.pause()
                 self.paused = True
                 pygame.mouse.set_visible(True)
 
+    @property
+    def static(self) -> bool:
+        """override - the level stands still while paused"""
+        return self.paused
+
     def update(self):
-        """Update level elements and draw to level's main surface"""
+        """Run one simulation tick of the level"""
         if self.paused:
             self.pause_menu.update()
-            self.__draw()
-            self.image.blit(self.pause_menu.image, self.pause_menu.rect)
         else:
             self.__update()
-            self.__draw()
+
+    def render(self, alpha: float = 1.0):
+        """Draw level elements to level's main surface"""
+        if not self.paused:
+            self.__draw(alpha)
+            return
+
+        if self.__frozen is None:
+            # nothing moves while paused, so the level is drawn once
+            self.__draw(alpha)
+            self.__frozen = self.image.copy()
+            self.pause_menu.dirty.invalidate()
+        # only the parts of the overlay that changed get put back on top
+        for rect in self.pause_menu.dirty.flush():
+            self.image.blit(self.__frozen, rect, rect)
+            self.image.blit(self.pause_menu.image, rect, rect)
+            # the overlay gets erased once the level is drawn again
+            self.dirty.add(rect)
@@ -1,93 +1,121 @@
-from pygame import event, sprite
+import json
+import os
+
+import numpy as np
+
+from pygame import sprite
 from src import settings
 
 from ...sprites import Enemy, Saucer
+from ...systems import EntityRegistry, ProjectileEngine, Scheduler, Steering
 
 
-class LevelOne:
+class Wave:
     """
-    Basic gameplay state with basic enemies
+    Gameplay state running a formation of enemies loaded from waves.json.
+    Every slot's offset, spawn time and occupancy is kept in numpy arrays,
+    its ship's health and position in the registry's tables,
+    so tracking and respawning the formation is a few array operations
     """
 
-    def __init__(self):
-        self.group: sprite.Group = sprite.Group()
-
-        img_width, img_height = Enemy.size
-
-        self.enemies: dict = {
-            "lead": {
-                "sprite": Enemy(),
-                "off-set-x": None,
-                "off-set-y": int(img_height * 3.5),
-            },
-            "left_flank": {
-                "sprite": Enemy(
-                    1250,
-                ),
-                "off-set-x": int(img_width * 2.5),
-                "off-set-y": int(img_height * 2.5),
-            },
-            "right_flank": {
-                "sprite": Enemy(
-                    1500,
-                ),
-                "off-set-x": int((img_width * 2.5) * -1),
-                "off-set-y": int(img_height * 2.5),
-            },
-            "rear": {
-                "sprite": Saucer(),
-                "off-set-x": 0,
-                "off-set-y": int((img_height / 2) + 1),
-            },
-        }
-
-        for position in self.enemies:
-            self.__spawn_enemy(position)
-
-    def __spawn_enemy(self, position: str):
+    path: str = os.path.join(os.path.dirname(__file__), "waves.json")
+    # ship names used in waves.json
+    ships: dict = {"enemy": Enemy, "saucer": Saucer}
+    # where ships enter the screen from
+    spawn_position: tuple = (settings.width / 2, -50)
+
+    def __init__(
+        self,
+        name: str,
+        projectiles: ProjectileEngine,
+        scheduler: Scheduler,
+        registry: EntityRegistry,
+    ):
         """
-        Create a new enemy and add it to the sprite group at the given
-        position in the formation
+        name: str -> key of the wave in waves.json,
+        projectiles: ProjectileEngine -> the level's, the enemies fire into it,
+        scheduler: Scheduler -> the level's, its clock times spawns and attacks,
+        registry: EntityRegistry -> the level's, spawned ships are filed into it
         """
-        enemy: Enemy = self.enemies[position]["sprite"]
-        enemy.recover()
-        enemy.set_position((settings.width / 2), -50)
-        enemy.attack()
-        self.group.add(enemy)
-
-    def pause(self) -> None:
-        """pause the states active timers"""
-        for enemy in self.group:
-            enemy.capture_attack_timers()
-
-    def unpause(self) -> None:
-        for enemy in self.group:
-            if not enemy.dying:
-                enemy.resume()
-
-    def check_events(self, event: event.Event):
-        """Check state specific events"""
-        # attack events
-        if hasattr(event, "attack"):
-            event.attack()
+        with open(self.path) as file:
+            wave: dict = json.load(file)[name]
+
+        self.scheduler = scheduler
+        self.registry = registry
+
+        slots: list = wave["slots"]
+        self.sprites: list = []
+        for slot in slots:
+            ship = self.ships[slot["ship"]](**slot.get("args", {}))
+            if "behaviour" in slot:
+                # a slot can steer its ship differently, see Steering.behaviours
+                ship.behaviour = slot["behaviour"]
+            ship.projectiles, ship.scheduler = projectiles, scheduler
+            self.sprites.append(ship)
+        self.__slot: dict = {ship: i for i, ship in enumerate(self.sprites)}
+        # registry row of every slot's ship
+        self.rows = np.array(
+            [registry.add(ship, ProjectileEngine.ENEMY, self.__vacate) for ship in self.sprites],
+            dtype=np.int64,
+        )
+        self.steering = Steering(registry, self.rows)
+
+        # x offset from the player, y the ship descends to
+        self.offsets = np.array([slot["offset"] for slot in slots], dtype=np.int64)
+        # milliseconds into the wave each slot is first filled
+        self.spawn = np.array([slot.get("spawn", 0) for slot in slots], dtype=np.float64)
+        # milliseconds an emptied slot waits to be filled again
+        self.respawn = np.array(
+            [slot.get("respawn", wave.get("respawn", 0)) for slot in slots], dtype=np.float64
+        )
+        self.occupied = np.zeros(len(slots), dtype=bool)
+        # scheduler time each empty slot gets filled at
+        self.due = self.spawn.copy()
+
+        self.__fill()
+
+    def __vacate(self, ship: sprite.Sprite) -> None:
+        """a ship was killed or removed, schedule its slot's respawn"""
+        i: int = self.__slot[ship]
+        self.occupied[i] = False
+        self.due[i] = self.scheduler.now + self.respawn[i]
+
+    def __fill(self) -> None:
+        """spawn a ship into every empty slot that is due"""
+        for i in np.flatnonzero(~self.occupied & (self.due <= self.scheduler.now)).tolist():
+            ship = self.sprites[i]
+            ship.recover()
+            ship.set_position(*self.spawn_position)
+            ship.attack()
+            self.registry.spawn(ship.row)
+            self.occupied[i] = True
+
+    def reset(self) -> None:
+        """start the wave over on the level's cleared scheduler and registry"""
+        for ship in self.sprites:
+            ship.cancel_timers()
+        self.occupied[:] = False
+        self.due[:] = self.spawn
+        self.__fill()
 
     def update(self, player_x: int):
         """
-        Update all of the sprites in self.enemies
+        Steer every ship towards its slot and fill the slots that are due
         """
-        for position in self.enemies:
-            if self.group.has(enemy := self.enemies[position]["sprite"]):
-                if enemy.health > 0:
-                    self.enemies[position]["sprite"].update(
-                        player_x + self.enemies[position]["off-set-x"]
-                        if self.enemies[position]["off-set-x"]
-                        else player_x,
-                        self.enemies[position]["off-set-y"]
-                        if self.enemies[position]["sprite"].rect.centery
-                        < self.enemies[position]["off-set-y"]
-                        else None,
-                    )
-                elif enemy.dying:
-                    enemy.update_particles()
-            else:
-                self.__spawn_enemy(position)
+        self.__fill()
+
+        slots = np.flatnonzero(self.occupied & (self.registry.health[self.rows] > 0))
+        rows = self.rows[slots]
+        # damaged animation, ahead of the move like the ships always ran it
+        self.registry.animate(rows)
+
+        offsets = self.offsets[slots]
+        # rect centery, the position truncated like a rect does
+        centery = self.registry.positions[rows, 1].astype(np.int64)
+        # ships descend until they reach their slot's height, then hold it
+        self.steering.update(
+            slots,
+            player_x + offsets[:, 0],
+            np.where(centery < offsets[:, 1], offsets[:, 1], 0),
+            player_x,
+        )
@@ -13,7 +13,6 @@ class GameOver(MenuBase):
 
         # adjust the main menu buttons font
         self.buttons[0].set_text("Main Menu", 32)
-        self.button_blit_seq = self._get_blitseq(self.buttons)
 
         mouse.set_visible(True)
 
@@ -36,13 +35,13 @@ class GameOver(MenuBase):
                     event.clear()
                     event.post(event.Event(QUIT))
 
+    def reset(self):
+        """override"""
+        super().reset()
+        mouse.set_visible(True)
+
     def check_events(self, event):
         if event.type == MOUSEBUTTONDOWN:
             self.__check_mousedown_events(event.pos)
         elif event.type == MOUSEBUTTONUP:
             self.__check_mouseup_events(event.pos)
-
-    def update(self):
-        self.image.fill((0, 0, 0))
-        self.image.blit(self.title, self.title_rect)
-        self.image.blits(self.button_blit_seq)
@@ -11,6 +11,11 @@ class MainMenu(MenuBase):
         self.next_screen: str = "level"
         mouse.set_visible(True)
 
+    def reset(self):
+        """override"""
+        super().reset()
+        mouse.set_visible(True)
+
     def check_events(self, _event):
         if _event.type == MOUSEBUTTONDOWN:
             for button in self.buttons:
@@ -23,8 +28,3 @@ class MainMenu(MenuBase):
                     elif button.key == keys.buttons.quit:
                         event.clear()
                         event.post(event.Event(QUIT))
-
-    def update(self):
-        self.image.fill((0, 0, 0))
-        self.image.blits(self.button_blit_seq)
-        self.image.blit(self.title, self.title_rect)
@@ -38,8 +38,3 @@ class PauseMenu(MenuBase):
             self.__check_button_down(event.pos)
         elif event.type == MOUSEBUTTONUP:
             self.__check_button_up(event.pos)
-
-    def update(self):
-        self.image.fill(self.background_color)
-        self.image.blit(self.title, self.title_rect)
-        self.image.blits(self.button_blit_seq)
@@ -3,3 +3,15 @@ width: int = 1280
 height: int = 720
 
 size: tuple = (width, height)
+
+# simulation ticks per second, every per-tick speed in the game is tuned for 60
+tick_rate: int = 60
+
+# upper bound on rendered frames per second, 0 lets vsync decide
+max_fps: int = 0
+
+# most simulation ticks run in a single frame before the backlog is dropped
+max_steps: int = 5
+
+# ticks per second while the active screen is static, 0 only wakes up on input
+idle_fps: int = 10
@@ -1,77 +1,45 @@
-from pygame import sprite, Surface
-from math import pi, sin, radians
+from pygame import Surface
 
 
-class _Projectile(sprite.Sprite):
-    """Projectile base class"""
+class _Projectile:
+    """
+    Projectile base class.
+    Describes how a kind of projectile looks and moves,
+    every live projectile is a row in the level's ProjectileEngine
+    """
 
-    def __init__(self, direct: int, size: tuple = None):
-        """
-        dir(direction): int -> 1 (moving down), -1 (moving up)
-        rect: tuple -> = (x, y, width, height)
-        """
-        super().__init__()
-        self.direction: int = direct
-        if size:
-            self.image: Surface = Surface(size)
-            self.rect = self.image.get_rect()
+    w_h: tuple = (0, 0)
+    color: tuple = (0, 0, 0)
+    damage: int = 0
+    # pixels moved along the direction every tick
+    speed: float = 0.0
+    # horizontal swing of a sine wave path, 0 flies straight
+    amplitude: float = 0.0
+    # fade between 100 and 255 alpha while flying
+    blink: bool = False
 
-    def set_position(self, x: int, y: int):
-        """set laser position using topleft"""
-        self.rect.x, self.rect.y = x, y
-        self.x, self.y = float(self.rect.x), float(self.rect.y)
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # shared by every projectile of a kind
+        cls.image: Surface = Surface(cls.w_h)
+        cls.image.fill(cls.color)
 
 
 class Laser(_Projectile):
     """projectile"""
 
     w_h: tuple = (6, 24)
-
-    def __init__(self, direct: int) -> None:
-        """
-        img: Surface -> laser.png
-        """
-        super().__init__(direct, self.w_h)
-        self.image.fill((255, 100, 100))
-
-        self.damage: int = 1
-
-    def update(self):
-        """
-        update laser pos
-        """
-        self.y += 15 * self.direction
-        self.rect.y = int(self.y)
+    color: tuple = (255, 100, 100)
+    damage: int = 1
+    speed: float = 15.0
 
 
 class SLaser(_Projectile):
     """Special attack laser"""
 
     w_h: tuple = (12, 12)
-
-    def __init__(self, direct: int) -> None:
-        super().__init__(direct, self.w_h)
-        self.image.fill((150, 150, 230))
-        self.image.convert_alpha()
-
-        self.alpha: int = 255
-        self.alpha_switch: int = 1
-
-        self.damage: int = 2
-
-    def update(self):
-        """
-        move the laser, dir: int -> 1 (moving down), -1 (moving up)
-        """
-        self.y += 4 * self.direction
-        self.x += 18 * sin(((2 * pi * 0.008) * self.y) + radians(self.y))
-
-        self.rect.y = int(self.y)
-        self.rect.x = int(self.x)
-
-        # Make the projectile blink
-        self.alpha -= 15 * self.alpha_switch
-        if not 100 <= self.alpha <= 255:
-            self.alpha_switch *= -1
-            self.alpha -= 30 * self.alpha_switch
-        self.image.set_alpha(self.alpha)
+    color: tuple = (150, 150, 230)
+    damage: int = 2
+    speed: float = 4.0
+    amplitude: float = 18.0
+    blink: bool = True
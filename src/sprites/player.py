@@ -1,10 +1,10 @@
 from typing import Literal
-from pygame import time
 from math import log
 from dataclasses import dataclass, field, make_dataclass
 
 from ..base import ShipBase
-from ..assets import get_image
+from ..assets import get_image, get_palette
+from .. import timestep
 from .laser import Laser
 
 
@@ -67,16 +67,17 @@ class Player(ShipBase):
         frozen=True,
     )
 
-    # active flags separated into lists by priority.
-    __active_flags: dict[list[int]] = {1: [], 2: []}  # priority flags
+    __base_health: int = 6
     __fire_cd: int = 250  # in milliseconds
     __direction: Literal[1, -1] = 1  # 1 = right, -1 = left. across x-axis
 
     def __init__(self) -> None:
-        super().__init__(get_image("player"), 6)
+        super().__init__(get_image("player"), self.__base_health)
         self.base_speed: float = 10.0
         self.movement_speed: float = 10.0
         self.firing: bool = False
+        # active flags separated into lists by priority.
+        self.__active_flags: dict[list[int]] = {1: [], 2: []}  # priority flags
         # flag callables
         self.__run_flag: dict[callable] = {
             self.flags.Fire.KEY: self._create_laser,
@@ -86,14 +87,14 @@ class Player(ShipBase):
         }
 
         if not Player.colors:
-            Player.colors = self._get_sprite_colors(self.image)
+            Player.colors = get_palette("player")
 
         row_wdth: int = int(self.screen_size[0] / 24)
         self.__recoil_bounds: tuple = (
             row_wdth,
             int(self.screen_size[0] - row_wdth),
         )
-        self.__prev_ticks: int = time.get_ticks()
+        self.__prev_ticks: int = timestep.get_ticks()
 
     @property
     def direction(self) -> int:
@@ -107,6 +108,11 @@ class Player(ShipBase):
             raise ValueError
         self.__direction = dir
 
+    def reset(self) -> None:
+        """get ready for a new run, keys held in the last one are let go"""
+        self._recover(self.__base_health)
+        self.__active_flags = {1: [], 2: []}
+
     def add_flag(self, flag: dataclass) -> None:
         """Add a flag to the active flags list"""
         if (
@@ -117,7 +123,9 @@ class Player(ShipBase):
 
     def remove_flag(self, flag: dataclass) -> None:
         """remove a flag from the active flags list"""
-        self.__active_flags[flag.priority].remove(flag)
+        # a key released after a reset was never added in this run
+        if flag in self.__active_flags[flag.priority]:
+            self.__active_flags[flag.priority].remove(flag)
 
     def __recoil(self) -> None:
         """React to a force"""
@@ -130,41 +138,31 @@ class Player(ShipBase):
             self.direction < 0 and self.x < self.__recoil_bounds[1]
         ):
             self.remove_flag(self.flags.Recoil)
-        else:
-            self.rect.centerx = int(self.x)
 
     def __move_left(self) -> None:
         """move the player to the left"""
         if self.x - self.movement_speed <= 0:
-            self.rect.centerx = 0
             self.x = 0.0
             # start recoil
             self.add_flag(self.flags.Recoil)
             self.direction = 1
         else:
             self.x -= self.movement_speed
-            self.rect.centerx = int(self.x)
 
     def __move_right(self) -> None:
         """move the player to the right"""
         if (self.x + self.movement_speed) > self.screen_size[0]:
             self.x = self.screen_size[0] - self.image.get_width()
-            self.rect.centerx = int(self.x)
             # start recoil
             self.add_flag(self.flags.Recoil)
             self.direction = -1
         else:
             self.x += self.movement_speed
-            self.rect.centerx = int(self.x)
 
     def _create_laser(self) -> None:
-        if self.__fire_cd < (time.get_ticks() - self.__prev_ticks):
+        if self.__fire_cd < (timestep.get_ticks() - self.__prev_ticks):
             super()._create_laser(-1, (self.rect.top - Laser.w_h[1]))
-            self.__prev_ticks = time.get_ticks()
-
-    def update_particles(self) -> None:
-        super().update_particles()
-        self.lasers.update()
+            self.__prev_ticks = timestep.get_ticks()
 
     def update(self, **kwargs) -> None:
         """update player movement and sprites"""
@@ -175,9 +173,5 @@ class Player(ShipBase):
         for flag in self.__active_flags[priority]:
             self.__run_flag[flag.KEY]()
 
-        super().update()
-
         if self.firing:
             self._create_laser()
-
-        self.lasers.update()
@@ -1,7 +1,13 @@
 import pygame
 
+from collections import OrderedDict
+
 from .screens import *
-from .assets import init as asset_init
+from .base import ScreenBase
+from .assets import init as asset_init, prefetch, hold, release
+from . import timestep
+from .profiler import FrameProfiler
+from .dirty import DirtyRects
 from .settings import size
 
 
@@ -10,28 +16,105 @@ class State:
 
     background: Background = Background(size)
     paused: bool = False
+    # total cache_weight of screens kept around for reuse, below the weight
+    # of every screen together so the least recently used one gets dropped
+    cache_budget: int = 5
 
-    def __init__(self):
-        # loads images
+    def __init__(self, profiler: FrameProfiler = None):
+        """profiler: FrameProfiler -> times the background and screen updates"""
+        self.profiler = profiler or FrameProfiler(capacity=1, enabled=False)
+        # regions of the display that need repainting
+        self.dirty = DirtyRects(self.background.rect)
+        # indexes images, they load as screens ask for them
         asset_init()
-        self.__active_screen = MainMenu()
 
         self.screens: dict = {
             "main_menu": MainMenu,
             "level": Level,
             "game_over": GameOver,
         }
+        # built screens, least recently used first
+        self.__cache: OrderedDict = OrderedDict()
+        self.change_screen("main_menu")
+
+    @property
+    def active_screen(self) -> ScreenBase:
+        return self.__active_screen
+
+    @property
+    def static(self) -> bool:
+        """whether the active screen only changes on input"""
+        return self.__active_screen.static
+
+    def change_screen(self, key: str) -> None:
+        """
+        make the screen stored under key the active screen,
+        reusing a cached instance when there is one
+        """
+        if screen := self.__cache.pop(key, None):
+            prefetch(screen.assets)
+            screen.reset()
+        else:
+            # the images stay loaded for as long as the screen is cached
+            hold(self.screens[key].assets)
+            screen = self.screens[key]()
+        self.__cache[key] = screen
+        self.__active_screen = screen
+        self.__evict()
+        self.invalidate()
+
+    def __evict(self) -> None:
+        """drop least recently used screens until the cache fits its budget"""
+        weight: int = sum(screen.cache_weight for screen in self.__cache.values())
+        for key in list(self.__cache):
+            if weight <= self.cache_budget:
+                break
+            if self.__cache[key] is not self.__active_screen:
+                screen: ScreenBase = self.__cache.pop(key)
+                weight -= screen.cache_weight
+                release(screen.assets)
+
+    def invalidate(self) -> None:
+        """repaint the whole display on the next draw"""
+        self.dirty.invalidate()
 
     def check_events(self, event) -> None:
         if event.type == self.__active_screen.CHANGESCREEN:
-            self.__active_screen = self.screens[self.__active_screen.next_screen]()
+            self.change_screen(self.__active_screen.next_screen)
         else:
             self.__active_screen.check_events(event)
 
     def update(self) -> None:
-        self.background.update()
-        self.__active_screen.update()
+        """run a single simulation tick"""
+        timestep.advance()
+        with self.profiler.phase("background"):
+            self.background.update()
+        with self.profiler.phase("screen"):
+            self.__active_screen.update()
 
-    def draw(self, display: pygame.Surface) -> None:
-        display.blit(self.background.image, self.background.rect)
-        display.blit(self.__active_screen.image, self.__active_screen.rect)
+    def draw(self, display: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        repaint the changed regions of the display and return them
+        alpha: float -> progress between the last two simulation ticks
+        """
+        self.__active_screen.render(alpha)
+        # nothing is erased from the display, the changes are only collected
+        for rect in (*self.background.dirty.flush(), *self.__active_screen.dirty.flush()):
+            self.dirty.mark(rect)
+        rects: list = self.dirty.flush()
+
+        if self.dirty.is_full(rects):
+            display.blit(self.background.image, self.background.rect)
+            # the screen is see-through outside what it drew, so only that is blended on top
+            screen = self.__active_screen
+            if len(screen.dirty.drawn) > screen.dirty.max_rects:
+                display.blit(screen.image, screen.rect)
+            else:
+                display.blits(
+                    [(screen.image, rect, rect) for rect in screen.dirty.drawn], doreturn=False
+                )
+        else:
+            for rect in rects:
+                display.blit(self.background.image, rect, rect)
+                display.blit(self.__active_screen.image, rect, rect)
+        return rects
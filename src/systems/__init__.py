@@ -0,0 +1,7 @@
+from .particles import ParticleEngine
+from .projectiles import ProjectileEngine
+from .spatial import SpatialHash
+from .scheduler import Scheduler, Timer
+from .steering import Steering
+from .starfield import Starfield
+from .entities import EntityRegistry
@@ -0,0 +1,249 @@
+import numpy as np
+
+from pygame import Rect
+
+from ..assets import with_alpha
+
+
+class Component:
+    """
+    Attribute of an entity stored in a column of the EntityRegistry it's filed in.
+    Until the entity is filed the value is kept on the entity itself
+    """
+
+    def __init__(self, column: str, default=None, index: int = None) -> None:
+        """
+        column: str -> name of the registry's table,
+        default: any -> value before anything was assigned,
+        index: int -> position along the table's second axis, for (n, 2) tables
+        """
+        self.column: str = column
+        self.default = default
+        self.index: int = index
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name: str = name
+
+    def __get__(self, entity, owner: type = None):
+        if entity is None:
+            return self
+        if entity.row is None:
+            return entity.__dict__.get(self.name, self.default)
+        table = getattr(entity.registry, self.column)
+        value = table[entity.row] if self.index is None else table[entity.row, self.index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def __set__(self, entity, value) -> None:
+        if entity.row is None:
+            entity.__dict__[self.name] = value
+        elif self.index is None:
+            getattr(entity.registry, self.column)[entity.row] = value
+        else:
+            getattr(entity.registry, self.column)[entity.row, self.index] = value
+
+
+class EntityRegistry:
+    """
+    Component tables every ship's state lives in, one row per ship.
+    A ship keeps its row for as long as the level owns it and only
+    its active flag changes as it enters and leaves play, so moving,
+    animating, drawing and culling ships are passes over the tables
+    """
+
+    # name -> (shape of a row, dtype)
+    __tables: dict = {
+        # transform, the rect is centered on the truncated position
+        "positions": ((2,), np.float64),
+        "size": ((2,), np.int64),
+        # rect topleft at the start of the current tick
+        "previous": ((2,), np.int64),
+        "movement_speed": ((), np.float64),
+        "base_speed": ((), np.float64),
+        # health and lifetime
+        "health": ((), np.int64),
+        "damaged": ((), bool),
+        "dying": ((), bool),
+        # id of the explosion in the level's ParticleEngine, -1 before there is one
+        "burst": ((), np.int64),
+        # render, image_alpha is drawn, alpha swings while the damaged flash runs
+        "image_alpha": ((), np.int64),
+        "alpha": ((), np.int64),
+        "alpha_switch": ((), np.int64),
+        "alpha_counter": ((), np.int64),
+        # ProjectileEngine.PLAYER or ProjectileEngine.ENEMY
+        "team": ((), np.int8),
+        # in play
+        "active": ((), bool),
+    }
+    # tables of python objects
+    __lists: tuple = ("entities", "images", "on_remove")
+    # components of every entity class filed so far
+    __components: dict = {}
+
+    def __init__(self, capacity: int = 32) -> None:
+        self.count: int = 0
+        for name, (shape, dtype) in self.__tables.items():
+            setattr(self, name, np.zeros((capacity, *shape), dtype=dtype))
+        for name in self.__lists:
+            setattr(self, name, [None] * capacity)
+
+    def __len__(self) -> int:
+        """number of entities in play"""
+        return int(self.active[: self.count].sum())
+
+    def __grow(self, needed: int) -> None:
+        """make room for at least needed rows"""
+        capacity: int = max(needed, len(self.entities) * 2)
+        for name in self.__tables:
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+        for name in self.__lists:
+            getattr(self, name).extend([None] * (capacity - len(getattr(self, name))))
+
+    def __components_of(self, kind: type) -> dict:
+        if (components := self.__components.get(kind)) is None:
+            components = self.__components[kind] = {
+                name: value
+                for klass in reversed(kind.__mro__)
+                for name, value in vars(klass).items()
+                if isinstance(value, Component)
+            }
+        return components
+
+    def add(self, entity, team: int, on_remove: callable = None) -> int:
+        """
+        give an entity a row, its components move into the tables,
+        it stays out of play until spawned
+        entity: ShipBase -> has Component attributes and registry and row attributes,
+        team: int -> ProjectileEngine.PLAYER or ProjectileEngine.ENEMY,
+        on_remove: callable -> called with the entity every time it gets removed,
+        returns the entity's row
+        """
+        i: int = self.count
+        if i == len(self.entities):
+            self.__grow(i + 1)
+        self.count += 1
+
+        self.entities[i] = entity
+        self.on_remove[i] = on_remove
+        self.team[i] = team
+        self.active[i] = False
+        for name, component in self.__components_of(type(entity)).items():
+            value = entity.__dict__.pop(name, component.default)
+            table = getattr(self, component.column)
+            if component.index is None:
+                table[i] = value
+            else:
+                table[i, component.index] = value
+        self.size[i] = self.images[i].get_size()
+
+        entity.registry, entity.row = self, i
+        return i
+
+    def topleft(self, rows) -> np.ndarray:
+        """(n, 2) rect topleft of rows, the same as centering a Rect on the position"""
+        return self.positions[rows].astype(np.int64) - self.size[rows] // 2
+
+    def rect(self, row: int) -> Rect:
+        return Rect(*self.topleft(row).tolist(), *self.size[row].tolist())
+
+    def spawn(self, row: int) -> None:
+        """put a row into play where it is, without interpolating from where it left"""
+        self.active[row] = True
+        self.previous[row] = self.topleft(row)
+
+    def remove(self, row: int) -> None:
+        """take a row out of play"""
+        if not self.active[row]:
+            return
+        self.active[row] = False
+        if (callback := self.on_remove[row]) is not None:
+            callback(self.entities[row])
+
+    def clear(self) -> None:
+        """take every row out of play without calling on_remove"""
+        self.active[: self.count] = False
+
+    def rows(self, team: int = None) -> np.ndarray:
+        """rows in play that aren't dying, of one team when given"""
+        n: int = self.count
+        living = self.active[:n] & ~self.dying[:n] & (self.health[:n] > 0)
+        if team is not None:
+            living &= self.team[:n] == team
+        return np.flatnonzero(living)
+
+    def snapshot(self) -> None:
+        """store where everything was before this tick moves it"""
+        self.previous[: self.count] = self.topleft(slice(0, self.count))
+
+    def damage(self, row: int, value: int) -> bool:
+        """
+        take health from a row, a hit ship flashes and slows down,
+        returns True when the hit killed it
+        """
+        if self.dying[row]:
+            return False
+        self.health[row] -= value
+        if self.health[row] <= 0:
+            self.dying[row] = True
+            return True
+        self.damaged[row] = True
+        self.movement_speed[row] /= 2
+        return False
+
+    def recover(self, rows) -> None:
+        """end the damaged flash and explosion of rows and restore their speed"""
+        self.dying[rows] = False
+        self.damaged[rows] = False
+        self.burst[rows] = -1
+        self.alpha_counter[rows] = 1
+        self.alpha[rows] = 255
+        self.image_alpha[rows] = 255
+        speed = self.movement_speed[rows]
+        self.movement_speed[rows] = self.base_speed[rows] * np.sign(speed)
+
+    def animate(self, rows) -> None:
+        """
+        one tick of the damaged flash of rows,
+        the alpha swings 3 times before the row recovers
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = rows[self.damaged[rows]]
+        if not len(rows):
+            return
+        alpha = self.alpha[rows] + 50 * self.alpha_switch[rows]
+        bounced = (alpha < 0) | (alpha > 255)
+        switch = np.where(bounced, -self.alpha_switch[rows], self.alpha_switch[rows])
+        self.alpha_switch[rows] = switch
+        self.alpha_counter[rows] += bounced
+        self.alpha[rows] = np.where(bounced, alpha + 100 * switch, alpha)
+
+        bounced = rows[bounced]
+        self.recover(bounced[self.alpha_counter[bounced] == 6])
+        self.image_alpha[bounced] = self.alpha[bounced]
+
+    def finished(self, bursts: np.ndarray) -> np.ndarray:
+        """
+        dead rows in play whose explosion faded out
+        bursts: np.ndarray -> ids of the explosions that still have particles
+        """
+        n: int = self.count
+        dead = np.flatnonzero(self.active[:n] & self.dying[:n] & (self.health[:n] <= 0))
+        return dead[~np.isin(self.burst[dead], bursts)]
+
+    def blit_sequence(self, alpha: float = 1.0) -> list:
+        """
+        (image, position) pairs of every row in play with health left for Surface.blits
+        alpha: float -> progress between the last two simulation ticks
+        """
+        rows = self.rows()
+        previous = self.previous[rows]
+        positions = (previous + (self.topleft(rows) - previous) * alpha).tolist()
+        return [
+            (with_alpha(self.images[i], opacity), position)
+            for i, opacity, position in zip(
+                rows.tolist(), self.image_alpha[rows].tolist(), positions
+            )
+        ]
@@ -0,0 +1,115 @@
+import numpy as np
+
+
+class ParticleEngine:
+    """
+    Every live explosion particle stored as contiguous numpy arrays,
+    moved and faded in a few vectorized operations per tick
+    """
+
+    # each palette color bursts out in these eight directions
+    directions = np.array(
+        (
+            # left, right, up, down
+            (-1, 0),
+            (1, 0),
+            (0, -1),
+            (0, 1),
+            # top left, bottom left, top right, bottom right
+            (-1, -1),
+            (-1, 1),
+            (1, -1),
+            (1, 1),
+        ),
+        dtype=np.float64,
+    )
+    # particles at or below this alpha are invisible and get removed
+    min_alpha: float = 20.0
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.count: int = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        # distance moved per tick
+        self.steps = np.zeros((capacity, 2), dtype=np.float64)
+        # alpha lost per tick
+        self.fade = np.zeros(capacity, dtype=np.float64)
+        self.alpha = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        # id of the explosion a particle belongs to
+        self.burst = np.zeros(capacity, dtype=np.int64)
+        self.__next_burst: int = 0
+
+    def __grow(self, needed: int) -> None:
+        """make room for at least needed particles"""
+        capacity: int = max(needed, len(self.alpha) * 2)
+        for name in ("positions", "steps", "fade", "alpha", "radius", "colors", "burst"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def emit(self, center: tuple[int, int], colors: tuple, width: int) -> int:
+        """
+        explode a ship into a ring of particles per palette color,
+        darker colors start smaller, further out and move faster
+        center: tuple -> ship's rect center,
+        colors: tuple -> ship's palette,
+        width: int -> ship's rect width.
+        returns the explosion's id, its particles carry it in the burst column
+        """
+        n = np.repeat(np.arange(len(colors), dtype=np.float64), len(self.directions))
+        directions = np.tile(self.directions, (len(colors), 1))
+        start, end = self.count, self.count + len(n)
+        if end > len(self.alpha):
+            self.__grow(end)
+
+        fade = 0.8 * (n + 1)
+        self.positions[start:end] = np.asarray(center) + n[:, None] * directions
+        self.steps[start:end] = np.trunc(fade[:, None] * directions)
+        self.fade[start:end] = fade
+        self.alpha[start:end] = 255.0
+        self.radius[start:end] = (width / 4) - n
+        self.colors[start:end] = np.repeat(
+            np.asarray(colors, dtype=np.uint8)[:, :3], len(self.directions), axis=0
+        )
+        self.burst[start:end] = self.__next_burst
+        self.count = end
+
+        self.__next_burst += 1
+        return self.__next_burst - 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def update(self) -> None:
+        """move, fade and shrink every particle then drop the invisible ones"""
+        n: int = self.count
+        self.positions[:n] += self.steps[:n]
+        alpha = self.alpha[:n]
+        alpha[:] = np.where((15.0 < alpha) & (alpha <= 255.0), alpha - self.fade[:n], 0.0)
+        self.radius[:n] -= 0.2
+
+        keep = alpha > self.min_alpha
+        if not keep.all():
+            kept: int = int(keep.sum())
+            for array in (
+                self.positions,
+                self.steps,
+                self.fade,
+                self.alpha,
+                self.radius,
+                self.colors,
+                self.burst,
+            ):
+                array[:kept] = array[:n][keep]
+            self.count = kept
+
+    def visible(self) -> tuple:
+        """positions, radii and rgba colors of the particles large enough to draw"""
+        n: int = self.count
+        shown = self.radius[:n] >= 1.0
+        rgba = np.empty((int(shown.sum()), 4), dtype=np.uint8)
+        rgba[:, :3] = self.colors[:n][shown]
+        rgba[:, 3] = self.alpha[:n][shown].astype(np.uint8)
+        return (self.positions[:n][shown], self.radius[:n][shown], rgba)
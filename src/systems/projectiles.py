@@ -0,0 +1,235 @@
+import numpy as np
+
+from pygame import Rect
+from pygame.mask import Mask
+
+from .spatial import SpatialHash
+from ..assets import with_alpha
+from ..settings import size
+from ..sprites.laser import Laser, SLaser
+
+
+class ProjectileEngine:
+    """
+    Every live projectile stored as contiguous numpy arrays,
+    moved, blinked and culled in a few vectorized operations per tick
+    """
+
+    # projectile kinds, a row's kind is an index into this
+    kinds: tuple = (Laser, SLaser)
+    # ships firing downwards are the enemies
+    PLAYER, ENEMY = 0, 1
+
+    # per kind constants, looked up with the kind column
+    __speed = np.array([kind.speed for kind in kinds], dtype=np.float64)
+    __amplitude = np.array([kind.amplitude for kind in kinds], dtype=np.float64)
+    __blink = np.array([kind.blink for kind in kinds], dtype=bool)
+    __size = np.array([kind.w_h for kind in kinds], dtype=np.int64)
+    __damage = np.array([kind.damage for kind in kinds], dtype=np.int64)
+    # projectiles are solid, so their masks are filled rects
+    __masks: tuple = tuple(Mask(kind.w_h, fill=True) for kind in kinds)
+
+    __columns: tuple = (
+        "team",
+        "kind",
+        "direction",
+        "positions",
+        "rects",
+        "previous",
+        "origin",
+        "damage",
+        "alpha",
+        "alpha_switch",
+        "spent",
+    )
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.count: int = 0
+        self.team = np.zeros(capacity, dtype=np.int8)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        # 1 (moving down), -1 (moving up)
+        self.direction = np.zeros(capacity, dtype=np.float64)
+        # float x, y the rects are truncated from
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        # x, y, w, h
+        self.rects = np.zeros((capacity, 4), dtype=np.int64)
+        # rect topleft at the start of the current tick
+        self.previous = np.zeros((capacity, 2), dtype=np.int64)
+        # rect topleft before the last update, collisions sweep from here to the rect
+        self.origin = np.zeros((capacity, 2), dtype=np.int64)
+        self.damage = np.zeros(capacity, dtype=np.int64)
+        self.alpha = np.zeros(capacity, dtype=np.int64)
+        self.alpha_switch = np.zeros(capacity, dtype=np.int64)
+        # hit something this tick, removed by the next cull
+        self.spent = np.zeros(capacity, dtype=bool)
+
+        self.grid = SpatialHash(Rect((0, 0), size))
+        # whether the grid is out of date with the rects
+        self.__stale: bool = True
+
+    def __grow(self, needed: int) -> None:
+        """make room for at least needed projectiles"""
+        capacity: int = max(needed, len(self.team) * 2)
+        for name in self.__columns:
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def __keep(self, keep: np.ndarray) -> None:
+        """compact the rows where keep is True to the front"""
+        kept: int = int(keep.sum())
+        if kept == self.count:
+            return
+        for name in self.__columns:
+            array = getattr(self, name)
+            array[:kept] = array[: self.count][keep]
+        self.count = kept
+        self.__stale = True
+
+    def fire(self, kind: type, direction: int, x: int, y: int) -> None:
+        """
+        add a projectile with its topleft at x, y
+        kind: type -> Laser or SLaser,
+        direction: int -> 1 (moving down), -1 (moving up)
+        """
+        i: int = self.count
+        if i == len(self.team):
+            self.__grow(i + 1)
+
+        k: int = self.kinds.index(kind)
+        self.team[i] = self.ENEMY if direction > 0 else self.PLAYER
+        self.kind[i] = k
+        self.direction[i] = direction
+        self.positions[i] = (x, y)
+        self.rects[i] = (x, y, *self.__size[k])
+        self.previous[i] = (x, y)
+        self.origin[i] = (x, y)
+        self.damage[i] = self.__damage[k]
+        self.alpha[i] = 255
+        self.alpha_switch[i] = 1
+        self.spent[i] = False
+        self.count += 1
+        self.__stale = True
+
+    def clear(self) -> None:
+        self.count = 0
+        self.__stale = True
+
+    def snapshot(self) -> None:
+        """store where every projectile was before this tick moves it"""
+        self.previous[: self.count] = self.rects[: self.count, :2]
+
+    def update(self) -> None:
+        """move and blink every projectile"""
+        n: int = self.count
+        kind = self.kind[:n]
+        x, y = self.positions[:n, 0], self.positions[:n, 1]
+        self.origin[:n] = self.rects[:n, :2]
+
+        y += self.__speed[kind] * self.direction[:n]
+        wave = self.__amplitude[kind]
+        x += wave * np.sin(((2 * np.pi * 0.008) * y) + np.radians(y)) * (wave != 0)
+        self.rects[:n, :2] = self.positions[:n]
+        self.__stale = True
+
+        blink = self.__blink[kind]
+        alpha, switch = self.alpha[:n], self.alpha_switch[:n]
+        alpha -= 15 * switch * blink
+        bounced = blink & ((alpha < 100) | (alpha > 255))
+        switch[bounced] *= -1
+        alpha[bounced] -= 30 * switch[bounced]
+
+    def cull(self, height: int) -> None:
+        """remove spent projectiles and the ones that left the top or bottom of the screen"""
+        rects = self.rects[: self.count]
+        self.__keep(
+            ~self.spent[: self.count] & (-rects[:, 3] < rects[:, 1]) & (rects[:, 1] < height)
+        )
+
+    def __sweep(self, rows: np.ndarray, rect: Rect) -> tuple:
+        """
+        slab test of every row's move over the last update against rect,
+        returns the part of the move each row spent overlapping it as
+        enter and leave fractions, overlapping rows have enter < leave
+        """
+        origin = self.origin[rows].astype(np.float64)
+        move = self.rects[rows, :2] - origin
+        # topleft positions where a row's rect overlaps rect
+        low = np.array((rect.left, rect.top)) - self.rects[rows, 2:]
+        high = np.array((rect.right, rect.bottom), dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            first = (low - origin) / move
+            second = (high - origin) / move
+        still = move == 0
+        inside = (low < origin) & (origin < high)
+        # not moving along an axis, it either always or never overlaps on it
+        first[still] = np.where(inside[still], -np.inf, np.inf)
+        second[still] = np.inf
+
+        enter = np.maximum(np.minimum(first, second).max(axis=1), 0.0)
+        leave = np.minimum(np.maximum(first, second).min(axis=1), 1.0)
+        return (enter, leave)
+
+    def __touches(self, row: int, enter: float, leave: float, rect: Rect, mask: Mask) -> bool:
+        """check if a row touches a set bit of mask anywhere between enter and leave"""
+        solid: Mask = self.__masks[self.kind[row]]
+        origin = self.origin[row]
+        move = self.rects[row, :2] - origin
+        # samples no further apart than the projectile is thin
+        samples: int = int(np.ceil(np.hypot(*move) * (leave - enter) / min(solid.get_size()))) + 1
+        for t in np.linspace(enter, leave, samples).tolist():
+            x, y = (origin + move * t).astype(np.int64).tolist()
+            if mask.overlap(solid, (x - rect.x, y - rect.y)) is not None:
+                return True
+        return False
+
+    def collide(self, rect: Rect, team: int, mask: Mask = None) -> list[int]:
+        """
+        spend a team's projectiles that crossed rect during their last move
+        and return the damage of each of them,
+        so fast projectiles can't skip over a ship between ticks
+        mask: Mask -> when given, a projectile has to touch a set bit
+        of it as well, placed at rect's topleft
+        """
+        if self.__stale:
+            # filed by the area swept over by their last move
+            n: int = self.count
+            swept = np.empty((n, 4), dtype=np.int64)
+            swept[:, :2] = np.minimum(self.origin[:n], self.rects[:n, :2])
+            swept[:, 2:] = self.rects[:n, 2:] + np.abs(self.rects[:n, :2] - self.origin[:n])
+            self.grid.build(swept, self.team[:n])
+            self.__stale = False
+
+        rows = self.grid.query(rect, team)
+        rows = rows[~self.spent[rows]]
+        enter, leave = self.__sweep(rows, rect)
+        hit = enter < leave
+        if mask is not None and hit.any():
+            hit[hit] = [
+                self.__touches(row, t0, t1, rect, mask)
+                for row, t0, t1 in zip(rows[hit].tolist(), enter[hit].tolist(), leave[hit].tolist())
+            ]
+        rows = rows[hit]
+        if not len(rows):
+            return []
+        rows.sort()
+        self.spent[rows] = True
+        return self.damage[rows].tolist()
+
+    def blit_sequence(self, alpha: float = 1.0) -> list:
+        """
+        (image, position) pairs for Surface.blits
+        alpha: float -> progress between the last two simulation ticks
+        """
+        n: int = self.count
+        previous = self.previous[:n]
+        positions = (previous + (self.rects[:n, :2] - previous) * alpha).tolist()
+        images: list = [kind.image for kind in self.kinds]
+        return [
+            (with_alpha(images[kind], opacity), position)
+            for kind, opacity, position in zip(
+                self.kind[:n].tolist(), self.alpha[:n].tolist(), positions
+            )
+        ]
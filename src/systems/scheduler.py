@@ -0,0 +1,74 @@
+import heapq
+
+from itertools import count
+
+
+class Timer:
+    """handle to a scheduled callback, cancel it to stop the callback from running"""
+
+    __slots__ = ("due", "period", "callback", "active")
+
+    def __init__(self, due: float, period: int, callback: callable) -> None:
+        # scheduler time the callback runs at
+        self.due: float = due
+        # time between repeats, 0 runs once
+        self.period: int = period
+        self.callback: callable = callback
+        # False once a one shot timer ran or the timer got cancelled
+        self.active: bool = True
+
+    def cancel(self) -> None:
+        self.active = False
+
+
+class Scheduler:
+    """
+    Runs callbacks after a delay on its own clock, kept in a heap by due time.
+    The clock only moves when advance is called, so not advancing it
+    pauses every timer and advancing again resumes them where they were
+    """
+
+    def __init__(self) -> None:
+        # milliseconds advanced so far, fractional as a tick is 1000 / 60 ms
+        self.now: float = 0.0
+        # (due, order scheduled, timer), the order keeps equal due times first in first out
+        self.__heap: list = []
+        self.__order = count()
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def __push(self, timer: Timer) -> None:
+        heapq.heappush(self.__heap, (timer.due, next(self.__order), timer))
+
+    def schedule(self, delay: int, callback: callable, repeat: bool = False) -> Timer:
+        """
+        run callback once delay milliseconds from now, or every delay milliseconds
+        delay: int -> milliseconds on the scheduler's clock,
+        repeat: bool -> keep running it until the timer is cancelled
+        """
+        timer = Timer(self.now + delay, delay if repeat else 0, callback)
+        self.__push(timer)
+        return timer
+
+    def advance(self, ms: float) -> None:
+        """move the clock forward and run every callback that came due, in due order"""
+        self.now += ms
+        heap: list = self.__heap
+        while heap and heap[0][0] <= self.now:
+            timer: Timer = heapq.heappop(heap)[2]
+            if not timer.active:
+                continue
+            if timer.period:
+                timer.due += timer.period
+                self.__push(timer)
+            else:
+                timer.active = False
+            timer.callback()
+
+    def clear(self) -> None:
+        """cancel every timer and reset the clock"""
+        for _, _, timer in self.__heap:
+            timer.active = False
+        self.__heap.clear()
+        self.now = 0.0
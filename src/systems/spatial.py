@@ -0,0 +1,66 @@
+import numpy as np
+
+from pygame import Rect
+
+
+class SpatialHash:
+    """
+    Uniform grid broadphase over a set of rects.
+    Every rect is filed under the cell of its topleft, per team,
+    so a query only looks at the rects in the cells around it
+    """
+
+    def __init__(self, bounds: Rect, cell: int = 64) -> None:
+        """
+        bounds: Rect -> area most rects are in, anything outside lands in the edge cells,
+        cell: int -> cell width and height, should be larger than any filed rect
+        """
+        self.bounds = Rect(bounds)
+        self.cell: int = cell
+        # one extra cell on every side for rects partly off the bounds
+        self.columns: int = -(-self.bounds.w // cell) + 2
+        self.rows: int = -(-self.bounds.h // cell) + 2
+        self.__keys = np.zeros(0, dtype=np.int64)
+        self.__order = np.zeros(0, dtype=np.int64)
+        # largest filed rect, how far a query reaches into the cells before it
+        self.__reach: tuple = (0, 0)
+
+    def __cells(self, x, y) -> tuple:
+        """grid column and row of a point, clamped to the grid"""
+        return (
+            np.clip((x - self.bounds.x) // self.cell + 1, 0, self.columns - 1),
+            np.clip((y - self.bounds.y) // self.cell + 1, 0, self.rows - 1),
+        )
+
+    def build(self, rects: np.ndarray, teams: np.ndarray) -> None:
+        """
+        file every rect
+        rects: np.ndarray -> (n, 4) x, y, w, h,
+        teams: np.ndarray -> (n,) team of each rect
+        """
+        columns, rows = self.__cells(rects[:, 0], rects[:, 1])
+        keys = (teams.astype(np.int64) * self.rows + rows) * self.columns + columns
+        self.__order = np.argsort(keys, kind="stable")
+        self.__keys = keys[self.__order]
+        self.__reach = (
+            (int(rects[:, 2].max()), int(rects[:, 3].max())) if len(rects) else (0, 0)
+        )
+
+    def query(self, rect: Rect, team: int) -> np.ndarray:
+        """indices of the team's rects that could overlap rect, in filing order"""
+        if not len(self.__keys):
+            return self.__order
+        (left, right), (top, bottom) = self.__cells(
+            np.array((rect.left - self.__reach[0], rect.right - 1)),
+            np.array((rect.top - self.__reach[1], rect.bottom - 1)),
+        )
+        # each grid row of the query is one run of consecutive keys
+        rows = np.arange(top, bottom + 1, dtype=np.int64)
+        first = (team * self.rows + rows) * self.columns
+        starts = np.searchsorted(self.__keys, first + left, side="left")
+        ends = np.searchsorted(self.__keys, first + right, side="right")
+        if len(rows) == 1:
+            return self.__order[starts[0] : ends[0]]
+        return np.concatenate(
+            [self.__order[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+        )
@@ -0,0 +1,70 @@
+import numpy as np
+
+from pygame import Surface, draw, RLEACCEL
+
+
+class Starfield:
+    """
+    Blinking stars scrolling down the screen in parallax layers.
+    A star's radius is its layer, bigger stars are closer and scroll faster.
+    Every layer's stars are drawn once onto a screen sized tile,
+    which scrolls as a whole by a wrapping offset and blinks through its surface alpha,
+    so a frame costs the same few blits however many stars there are
+    """
+
+    color: tuple = (255, 255, 175)
+    radii: tuple = (1, 2, 3)
+    # alpha every layer blinks around, the farthest layer is the dimmest
+    alphas: tuple = (60, 80, 100)
+    # alpha change per tick while blinking
+    blink_step: int = 2
+    # transparent pixels of the tiles
+    colorkey: tuple = (0, 0, 0)
+
+    def __init__(self, w_h: tuple, count: int) -> None:
+        """
+        w_h: tuple -> (screen_width, screen_height),
+        count: int -> number of stars
+        """
+        self.width, self.height = w_h
+        self.rng = np.random.default_rng()
+        radius = self.rng.choice(self.radii, count)
+        self.tiles: list = [self.__tile(r, int((radius == r).sum())) for r in self.radii]
+
+        # per layer, scroll speed and how far the tile has scrolled down
+        self.speed = np.array(self.radii, dtype=np.int64)
+        self.offset = self.rng.integers(0, self.height, len(self.radii))
+        self.alpha = np.array(self.alphas, dtype=np.int64)
+        # each layer blinks within its own range around its starting alpha
+        self.alpha_limits = np.column_stack((self.alpha - 51, self.alpha + 50))
+        # layers start out of step with each other
+        self.alpha += self.rng.integers(-50, 50, len(self.radii), endpoint=True)
+        self.alpha_step = self.rng.choice((-self.blink_step, self.blink_step), len(self.radii))
+
+    def __tile(self, radius: int, count: int) -> Surface:
+        """a layer's tile, count stars of radius scattered over the screen"""
+        tile = Surface((self.width, self.height))
+        tile.fill(self.colorkey)
+        x = self.rng.integers(0, self.width, count, endpoint=True)
+        y = self.rng.integers(0, self.height, count)
+        for center in zip(x.tolist(), y.tolist()):
+            draw.circle(tile, self.color, center, radius)
+            # stars across the bottom edge carry on at the top
+            draw.circle(tile, self.color, (center[0], center[1] - self.height), radius)
+        tile.set_colorkey(self.colorkey, RLEACCEL)
+        return tile
+
+    def blit_sequence(self) -> list:
+        """(tile, top left) pairs for Surface.blits, two per layer to cover the wrap"""
+        sequence: list = []
+        for tile, alpha, offset in zip(self.tiles, self.alpha.tolist(), self.offset.tolist()):
+            tile.set_alpha(alpha, RLEACCEL)
+            sequence += ((tile, (0, offset)), (tile, (0, offset - self.height)))
+        return sequence
+
+    def update(self) -> None:
+        """blink and scroll every layer"""
+        at_limit = (self.alpha_limits[:, 0] >= self.alpha) | (self.alpha_limits[:, 1] <= self.alpha)
+        self.alpha_step[at_limit] *= -1
+        self.alpha += self.alpha_step
+        self.offset = (self.offset + self.speed) % self.height
@@ -0,0 +1,74 @@
+import numpy as np
+
+from ..settings import width, height
+
+
+class Steering:
+    """
+    Moves a fixed set of ships together, every ship's behaviour is
+    computed for all of them in one numpy step over the position and
+    speed tables of the registry they are filed in.
+    Behaviours:
+    track -> ease towards a target,
+    bounce -> sweep between the screen edges,
+    dive -> track the player then drop onto them once lined up
+    """
+
+    behaviours: tuple = ("track", "bounce", "dive")
+    # a tracking ship closes 1 / track_rate of the distance every tick
+    track_rate: float = 40.0
+    # horizontal distance to the player a diving ship drops from
+    dive_window: int = 48
+    # dive speed as a multiple of the ship's movement speed
+    dive_factor: float = 3.0
+
+    def __init__(self, registry, rows: np.ndarray) -> None:
+        """
+        registry: EntityRegistry -> the ships are filed in,
+        rows: np.ndarray -> registry row of every ship, each with a behaviour class attribute
+        """
+        self.registry = registry
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.kind = np.array(
+            [self.behaviours.index(registry.entities[row].behaviour) for row in self.rows.tolist()]
+        )
+        half = registry.size[self.rows, 0] // 2
+        # centerx range a bouncing ship turns around outside of
+        self.bounds = np.stack((half, width - half), axis=1)
+        # lowest centery a diving ship drops to, its rect still on screen
+        self.floor = height - registry.size[self.rows, 1] // 2
+
+    def update(self, ships: np.ndarray, target_x: np.ndarray, target_y: np.ndarray, player_x: int):
+        """
+        move ships one tick
+        ships: np.ndarray -> indexes into rows,
+        target_x: np.ndarray -> centerx each ship heads for,
+        target_y: np.ndarray -> centery each ship descends to, 0 once it got there,
+        player_x: int -> centerx of the player, for diving ships
+        """
+        if not len(ships):
+            return
+        rows = self.rows[ships]
+        positions, speeds = self.registry.positions, self.registry.movement_speed
+        x, y, speed = positions[rows, 0], positions[rows, 1], speeds[rows]
+        # rects are centered on the truncated position
+        centerx, centery = np.trunc(x), np.trunc(y)
+        kind = self.kind[ships]
+        bounce, dive = (kind == self.behaviours.index(name) for name in ("bounce", "dive"))
+        descending = target_y != 0
+
+        # x
+        bounds = self.bounds[ships]
+        turn = bounce & ~((bounds[:, 0] <= centerx) & (centerx <= bounds[:, 1]))
+        speed = np.where(turn, -speed, speed)
+        heading = np.where(dive, player_x, target_x)
+        x = np.where(bounce, x + speed, x + (heading - centerx) / self.track_rate)
+
+        # y
+        y = np.where(descending, y + (target_y - centery) / self.track_rate, y)
+        drop = dive & ~descending & (np.abs(player_x - centerx) < self.dive_window)
+        y = np.where(drop, np.minimum(y + np.abs(speed) * self.dive_factor, self.floor[ships]), y)
+
+        positions[rows, 0] = x
+        positions[rows, 1] = y
+        speeds[rows] = speed
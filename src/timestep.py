@@ -0,0 +1,55 @@
+from .settings import tick_rate, max_steps
+
+
+# length of one simulation tick in milliseconds
+step_ms: float = 1000 / tick_rate
+# simulated time in milliseconds, advanced once per tick
+_sim_ticks: float = 0.0
+
+
+def advance() -> None:
+    """move the simulation clock forward by one tick"""
+    global _sim_ticks
+    _sim_ticks += step_ms
+
+
+def get_ticks() -> int:
+    """simulation counterpart of pygame.time.get_ticks"""
+    return int(_sim_ticks)
+
+
+class FixedTimestep:
+    """
+    Collects real frame time and hands it out as
+    a whole number of fixed length simulation ticks
+    """
+
+    def __init__(self, max_steps_: int = max_steps) -> None:
+        self.max_steps: int = max_steps_
+        self.accumulator: float = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """progress from the last simulated tick towards the next one, 0 -> 1"""
+        return self.accumulator / step_ms
+
+    def accumulate(self, frame_ms: float) -> None:
+        """add the real time the last frame took"""
+        self.accumulator += frame_ms
+
+    def reset(self) -> None:
+        """drop the collected time, so time spent idle isn't simulated afterwards"""
+        self.accumulator = 0.0
+
+    def steps(self) -> int:
+        """
+        number of ticks to simulate this frame
+        if rendering fell too far behind the backlog is dropped
+        so the simulation slows down instead of spiralling
+        """
+        steps: int = int(self.accumulator // step_ms)
+        if steps > self.max_steps:
+            self.accumulator %= step_ms
+            return self.max_steps
+        self.accumulator -= steps * step_ms
+        return steps
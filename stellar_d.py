@@ -1,10 +1,15 @@
+import os
 import pygame
 import src
 from sys import exit
+from time import perf_counter
 
 
 class StellarDefender:
-    def __init__(self):
+    def __init__(self, profile_path: str = None):
+        """
+        profile_path: str -> where the frame timings are written on exit (.csv or .json)
+        """
         pygame.init()
         self.main_screen = pygame.display.set_mode(
             src.size, flags=pygame.SCALED, vsync=1
@@ -12,27 +17,170 @@ class StellarDefender:
 
         pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.TEXTINPUT])
 
-        self.state = src.State()
+        self.profile_path: str = profile_path
+        self.profiler = src.FrameProfiler()
+        self.state = src.State(self.profiler)
         self.clock = pygame.time.Clock()
+        self.timestep = src.FixedTimestep()
+
+    def quit(self):
+        """write out the frame timings and close the game"""
+        if self.profile_path:
+            self.profiler.dump(self.profile_path)
+        pygame.quit()
+        exit()
+
+    def __idle(self) -> list:
+        """
+        sleep until there is input or the next idle tick is due
+        and return the event that woke the loop up, if any
+        """
+        timeout: int = int(1000 / src.idle_fps) if src.idle_fps else 0
+        woken_by = pygame.event.wait(timeout)
+        # the time spent waiting is not simulated
+        self.clock.tick()
+        self.timestep.reset()
+        return [] if woken_by.type == pygame.NOEVENT else [woken_by]
 
     def run_game(self):
         """runs the main loop of the game"""
         while 1:
-            self.clock.tick(60)
+            if self.state.static:
+                # menus only change on input, run a single tick per wake up
+                with self.profiler.phase("idle"):
+                    events: list = self.__idle()
+                steps: int = 1
+            else:
+                # render as often as the display allows and
+                # simulate in fixed ticks to keep up with real time
+                self.timestep.accumulate(self.clock.tick(src.max_fps))
+                events: list = []
+                steps: int = self.timestep.steps()
+
+            with self.profiler.phase("events"):
+                for event in [*events, *pygame.event.get()]:
+                    if event.type == pygame.QUIT:
+                        self.quit()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.profiler.toggle_overlay()
+                        self.state.invalidate()
+                    else:
+                        self.state.check_events(event)
+
+            for _ in range(steps):
+                self.state.update()
+
+            with self.profiler.phase("draw"):
+                rects = self.state.draw(self.main_screen, self.timestep.alpha)
+                if overlay := self.profiler.draw_overlay(self.main_screen):
+                    rects.append(overlay)
+                    # repaint under the translucent overlay before it's drawn again
+                    self.state.dirty.mark(overlay)
+
+            with self.profiler.phase("flip"):
+                # only push the regions that changed
+                pygame.display.update(rects)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    exit()
-                else:
+            self.profiler.end_frame()
+
+
+class HeadlessDefender:
+    """
+    Runs the game without a window, vsync or frame cap,
+    stepping the simulation as fast as the cpu allows.
+    Used to soak test balance and stability changes
+    """
+
+    # ticks between the autopilot switching direction
+    sweep_ticks: int = 90
+
+    def __init__(self, render: bool = False, profile_path: str = None):
+        """
+        render: bool -> also draw every tick onto an offscreen surface,
+        profile_path: str -> where the tick timings are written (.csv or .json)
+        """
+        # the dummy driver has to be picked before pygame.init
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+
+        self.render: bool = render
+        self.profile_path: str = profile_path
+        self.profiler = src.FrameProfiler()
+        self.canvas = pygame.Surface(src.size)
+        self.state = src.State(self.profiler)
+        self.state.change_screen("level")
+
+        self.game_overs: int = 0
+        self.__held_key: int = pygame.K_a
+
+    def __autopilot(self, tick: int):
+        """
+        hold fire and sweep the player from side to side,
+        the keys are pressed every tick so a fresh level picks them up too
+        """
+        if tick and tick % self.sweep_ticks == 0:
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=self.__held_key))
+            self.__held_key = pygame.K_d if self.__held_key == pygame.K_a else pygame.K_a
+        for key in (pygame.K_SPACE, self.__held_key):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def run(self, ticks: int) -> dict:
+        """simulate a number of ticks and return run statistics"""
+        start: float = perf_counter()
+
+        for tick in range(ticks):
+            self.__autopilot(tick)
+
+            with self.profiler.phase("events"):
+                for event in pygame.event.get():
                     self.state.check_events(event)
 
+            # retry straight away instead of waiting on the game over menu
+            if not isinstance(self.state.active_screen, src.screens.Level):
+                self.game_overs += 1
+                self.state.change_screen("level")
+
             self.state.update()
-            self.state.draw(self.main_screen)
+            if self.render:
+                with self.profiler.phase("draw"):
+                    self.state.draw(self.canvas)
+
+            self.profiler.end_frame()
 
-            pygame.display.update()
+        elapsed: float = perf_counter() - start
+        if self.profile_path:
+            self.profiler.dump(self.profile_path)
+        return {
+            "ticks": ticks,
+            "game_seconds": ticks / src.tick_rate,
+            "real_seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed else 0.0,
+            "game_overs": self.game_overs,
+        }
 
 
 if __name__ == "__main__":
-    stellar_defender = StellarDefender()
-    stellar_defender.run_game()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stellar-D")
+    parser.add_argument(
+        "--headless",
+        type=int,
+        metavar="TICKS",
+        help="simulate TICKS ticks without a window as fast as possible",
+    )
+    parser.add_argument(
+        "--render", action="store_true", help="draw offscreen while headless"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="write per phase frame timings to PATH (.csv or .json) on exit",
+    )
+    args = parser.parse_args()
+
+    if args.headless is not None:
+        print(HeadlessDefender(args.render, args.profile).run(args.headless))
+    else:
+        stellar_defender = StellarDefender(args.profile)
+        stellar_defender.run_game()